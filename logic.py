@@ -13,8 +13,16 @@ class PlayerLogic:
         self.shuffle_pos = 0
         self.repeat_mode = REPEAT_OFF
 
-    def rebuild_shuffle_order(self, keep_current: bool):
+    def rebuild_shuffle_order(self, keep_current: bool, new_count: int = 0):
+        if not self.shuffle_enabled:
+            # Nothing reads the order until shuffle is turned on, which rebuilds it.
+            self.shuffle_order = []
+            self.shuffle_pos = 0
+            return
         size = len(self.playlist)
+        if new_count > 0 and self.shuffle_order and len(self.shuffle_order) == size - new_count:
+            self._extend_shuffle_order(size - new_count, size)
+            return
         self.shuffle_order = list(range(size))
         if size == 0:
             self.shuffle_pos = 0
@@ -29,6 +37,18 @@ class PlayerLogic:
         else:
             self.shuffle_pos = 0
 
+    def _extend_shuffle_order(self, start: int, stop: int):
+        # Appended rows are spread at random through the not-yet-played part of the order.
+        new_items = list(range(start, stop))
+        random.shuffle(new_items)
+        head = self.shuffle_order[: self.shuffle_pos + 1]
+        tail = self.shuffle_order[self.shuffle_pos + 1 :]
+        slots = set(random.sample(range(len(tail) + len(new_items)), len(new_items)))
+        new_iter = iter(new_items)
+        tail_iter = iter(tail)
+        merged = [next(new_iter) if slot in slots else next(tail_iter) for slot in range(len(tail) + len(new_items))]
+        self.shuffle_order = head + merged
+
     def sync_shuffle_pos_to_current(self):
         if not self.shuffle_enabled:
             return
@@ -158,6 +158,9 @@ def run() -> int:
     _log_runtime_tool_diagnostics()
     setup_i18n()
 
+    # Overlays are separate top-level windows, so main-window siblings never overlap
+    # and Qt's opaque-sibling subtraction on every update is wasted work.
+    os.environ.setdefault("QT_NO_SUBTRACTOPAQUESIBLINGS", "1")
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(True)
 
@@ -7,6 +7,7 @@ import tempfile
 import ctypes
 from ctypes import wintypes
 from collections import deque
+from functools import lru_cache
 import threading
 import weakref
 from pathlib import Path
@@ -16,7 +17,7 @@ import time
 import mpv
 
 from PySide6.QtCore import QTimer, Qt, Signal, QPoint, QAbstractNativeEventFilter
-from PySide6.QtGui import QCursor, QIcon, QPixmap
+from PySide6.QtGui import QCursor, QPixmap
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QApplication,
@@ -45,25 +46,7 @@ from .settings import (
     load_stream_quality,
 )
 from .ui.icons import (
-    icon_close,
     icon_folder,
-    icon_minus,
-    icon_playlist,
-    icon_plus,
-    icon_repeat,
-    icon_sort,
-    icon_search,
-    icon_maximize,
-    icon_restore,
-    icon_restore_playlist,
-    icon_fullscreen,
-    icon_shuffle,
-    icon_save,
-    icon_open_folder,
-
-
-    icon_trash,
-    icon_settings,
     get_app_icon,
 )
 from .ui.styles import PANEL_STYLE, PLAYLIST_STYLE, MENU_STYLE, TITLE_BAR_STYLE
@@ -95,6 +78,7 @@ from .utils import (
 from .playlist import (
     PlaylistViewMixin,
     URLResolveWorker,
+    _http_auth_host,
     _is_youtube_url,
     _youtube_direct_video_url,
 )
@@ -111,6 +95,30 @@ APPCOMMAND_MEDIA_PAUSE = 47
 
 
 
+@lru_cache(maxsize=1024)
+def _fallback_track_display_name(source: str) -> str:
+    # Name derived from the source itself, used when no title is known.
+    try:
+        if is_archive_member_source(source):
+            archive_path, member_name = parse_archive_member_source(source)
+            archive_label = Path(archive_path).name if archive_path else ""
+            member_label = Path(member_name).name if member_name else "Archive item"
+            return f"{member_label} [{archive_label}]" if archive_label else member_label
+        parsed = urlparse(source)
+        if parsed.scheme and parsed.netloc:
+            if _is_youtube_url(source):
+                direct_yt = _youtube_direct_video_url(source)
+                if direct_yt:
+                    vid = parse_qs(urlparse(direct_yt).query).get("v", [""])[0]
+                    return f"YouTube {vid}" if vid else "YouTube"
+                return "YouTube"
+            return unquote(Path(parsed.path.rstrip("/")).name) or parsed.netloc
+        return os.path.basename(source)
+    except (TypeError, ValueError):
+        return source
+
+
+
 class _WindowsMediaNativeEventFilter(QAbstractNativeEventFilter):
     def __init__(self, player):
         super().__init__()
@@ -194,26 +202,56 @@ class ProOverlayPlayer(QMainWindow, PlayerLogic, PlaylistViewMixin, UIEventsMixi
         self._next_duration_scan_attempt_at = 0.0
         self._last_position = 0.0
         self._last_duration = 0.0
+        self._next_duration_read_at = 0.0
         self._last_progress_time = 0.0
         self._unsafe_mpv_read_allowed_at = 0.0
         self._last_seek_cmd_time = 0.0
         self._auto_next_deadline = 0.0
         self._quality_reload_until = 0.0
         self._user_paused = False
-        self._pending_duration_paths = []
-        self._pending_model_appends = []
+        # Overlay windows are created further down; None until then.
+        self.playlist_overlay = None
+        self.title_bar = None
+        # Filled in by setup_playlist_ui; None until then.
+        self.playlist_widget = None
+        self.playlist_model = None
+        self.playlist_filter_model = None
+        self.playlist_search_input = None
+        self._last_highlighted_index = -1
+        self._time_label_key = None
+        self._timeline_key = None
+        self._sync_size_cache = None
+        self._cached_screen_rect = None
+        self._screen_rect_source = None
+        self._screen_rect_hooked = False
+        self._filter_can_reorder = None
+        self._path_to_index = {}
+        self._playlist_keys = set()
+        self._playlist_keys_source = None
+        self._playlist_keys_len = 0
+        self._pending_duration_paths = deque()
+        self._pending_duration_set = set()
+        self._pending_model_appends = deque()
         self._active_prepare_worker = None
         self._active_prepare_request = None
         self._prepare_queue = deque()
+        self._session_snapshot_deferred = False
+        self._drop_triage_workers = set()
+        self._m3u_io_workers = set()
+        self._startup_collect_worker = None
         self._active_url_worker = None
         self._active_url_request = None
         self._url_queue = deque()
         self._url_resolve_active = False
         self._is_shutting_down = False
-        self._url_status_timer = QTimer(self)
+        # Everything registered here is stopped/closed in closeEvent.
+        self._managed_timers = []
+        self._managed_overlays = []
+        self._url_status_timer = self._create_managed_timer()
         self._url_status_timer.setInterval(450)
         self._url_status_timer.timeout.connect(self._refresh_url_resolve_status)
         self._stream_auth_by_host = {}
+        self._applied_http_header = None
         self._stream_quality_cache = {}
         self._stream_auth_cache_limit = 512
         self._stream_quality_cache_limit = 256
@@ -221,23 +259,55 @@ class ProOverlayPlayer(QMainWindow, PlayerLogic, PlaylistViewMixin, UIEventsMixi
         self._mpv_prop_error_logged = set()
         self._url_progress_count = 0
 
-        self._append_chunk_timer = QTimer(self)
+        self._append_chunk_timer = self._create_managed_timer()
         self._append_chunk_timer.setInterval(0)
         self._append_chunk_timer.timeout.connect(self._drain_model_append_queue)
-        self._import_status_timer = QTimer(self)
+        self._import_status_timer = self._create_managed_timer()
         self._import_status_timer.setInterval(350)
         self._import_status_timer.timeout.connect(self._refresh_import_status)
         self._import_progress_active = False
         self._import_progress_count = 0
+        self._last_import_status_count = -1
+        self._last_import_status_text = ""
         self._script_bindings_cache = {}
         self._script_bindings_mtime = 0.0
-        self._search_debounce_timer = QTimer(self)
+        self._icon_cache = {}
+        self._owned_windows = (self,)
+        self._cached_focus_state = None
+        self._search_filter_pending = False
+        self._search_debounce_timer = self._create_managed_timer()
         self._search_debounce_timer.setSingleShot(True)
-        self._search_debounce_timer.setInterval(120)
-        self._search_debounce_timer.timeout.connect(self.apply_playlist_filter)
+        self._search_debounce_timer.setInterval(150)
+        self._search_debounce_timer.timeout.connect(self._flush_playlist_filter)
+        self._search_max_delay_timer = self._create_managed_timer()
+        self._search_max_delay_timer.setSingleShot(True)
+        self._search_max_delay_timer.setInterval(600)
+        self._search_max_delay_timer.timeout.connect(self._flush_playlist_filter)
+        self._pending_seek = 0
+        self._pending_duration_updates = {}
+        self._duration_flush_timer = self._create_managed_timer()
+        self._duration_flush_timer.setSingleShot(True)
+        self._duration_flush_timer.setInterval(100)
+        self._duration_flush_timer.timeout.connect(self._flush_duration_updates)
+        self._last_af_key = None
+        self._eq_cache = None
+        self._eq_apply_timer = self._create_managed_timer()
+        self._eq_apply_timer.setSingleShot(True)
+        self._eq_apply_timer.setInterval(50)
+        self._eq_apply_timer.timeout.connect(self._apply_cached_equalizer)
+        self._seek_timer = self._create_managed_timer()
+        self._seek_timer.setSingleShot(True)
+        self._seek_timer.setInterval(16)
+        self._seek_timer.timeout.connect(self._flush_pending_seek)
+        self._geometry_sync_pending = False
+        self._geometry_sync_timer = self._create_managed_timer()
+        self._geometry_sync_timer.setSingleShot(True)
+        self._geometry_sync_timer.setInterval(16)
+        self._geometry_sync_timer.timeout.connect(self._on_geometry_sync_timeout)
 
         self.saved_volume = load_volume()
         self.saved_muted = load_muted()
+        self._refresh_status_templates()
 
         self.central_widget = QWidget()
         self.central_widget.setMouseTracking(True)
@@ -367,15 +437,18 @@ class ProOverlayPlayer(QMainWindow, PlayerLogic, PlaylistViewMixin, UIEventsMixi
         self.speed_overlay = PillOverlayWindow(self)
         self.playlist_overlay = OverlayWindow(self)
         self.title_bar = TitleBarOverlay(self)
+        self._managed_overlays = [self.overlay, self.speed_overlay, self.playlist_overlay, self.title_bar]
+        self._owned_windows = (self, self.title_bar, self.overlay, self.playlist_overlay, self.speed_overlay)
+        self._cached_focus_state = None
 
-        self.speed_indicator_timer = QTimer(self)
+        self.speed_indicator_timer = self._create_managed_timer()
         self.speed_indicator_timer.setSingleShot(True)
         self.speed_indicator_timer.setInterval(900)
         self.speed_indicator_timer.timeout.connect(self.speed_overlay.hide)
         self._status_overlay_default_ms = 900
         self._status_overlay_error_ms = 3200
 
-        self.playlist_auto_hide_timer = QTimer(self)
+        self.playlist_auto_hide_timer = self._create_managed_timer()
         self.playlist_auto_hide_timer.setSingleShot(True)
         self.playlist_auto_hide_timer.setInterval(3000) # 3 second delay
         self.playlist_auto_hide_timer.timeout.connect(self.playlist_overlay.hide)
@@ -394,6 +467,18 @@ class ProOverlayPlayer(QMainWindow, PlayerLogic, PlaylistViewMixin, UIEventsMixi
 
         self.setup_ui()
         self.setup_playlist_ui()
+        # Qt mouse events drive overlay updates directly; the UI tick only covers the
+        # cursor idle countdown and moves over the native mpv surface, which Qt never sees.
+        self._title_restore_pending = False
+        self._playlist_first_show_done = False
+        self._mouse_timer_fast_interval = 100
+        self._mouse_timer_slow_interval = 200
+        self._mouse_timer_idle_interval = 500
+        self._mouse_poll_interval_ms = self._mouse_timer_fast_interval
+        self._mouse_poll_elapsed_ms = 0
+        self._mouse_poll_suspended = True  # released once the UI tick is running
+        self._pointer_event_min_interval = 0.016
+        self._last_pointer_event_check = 0.0
         QApplication.instance().installEventFilter(self)
 
         self.overlay.hide()
@@ -408,25 +493,29 @@ class ProOverlayPlayer(QMainWindow, PlayerLogic, PlaylistViewMixin, UIEventsMixi
         if self.pinned_playlist:
             self.playlist_overlay.show()
 
-        self.mouse_timer = QTimer(self)
-        self.mouse_timer.setInterval(100)
-        self.mouse_timer.timeout.connect(self.check_mouse_pos)
-        self.mouse_timer.start()
-        self._mouse_timer_fast_interval = 100
-        self._mouse_timer_slow_interval = 180
-        
         self.last_cursor_global_pos = QCursor.pos()
         self.cursor_idle_time = 0
 
-        self.ui_timer = QTimer(self)
+        self.ui_timer = self._create_managed_timer()
         self.ui_timer.setInterval(100) # Increased frequency from 200ms
-        self.ui_timer.timeout.connect(self.force_ui_update)
+        self.ui_timer.timeout.connect(self._on_main_tick)
         self.ui_timer.start()
 
         self.dragpos = None
         self._is_resizing = False # Add this
+        self._pending_drag_move = None
+        self._drag_move_timer = self._create_managed_timer()
+        self._drag_move_timer.setSingleShot(True)
+        self._drag_move_timer.setInterval(0)
+        self._drag_move_timer.timeout.connect(self._apply_pending_drag_move)
+        self._pending_resize = None
+        self._resize_timer = self._create_managed_timer()
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(16)
+        self._resize_timer.timeout.connect(self._apply_pending_resize)
         self._context_menu_open = False
         self._fullscreen_transition_active = False
+        self._mouse_poll_suspended = False
         self._windowed_was_maximized_before_fullscreen = False
         self._last_media_command = None
         self._last_media_command_at = 0.0
@@ -609,9 +698,9 @@ class ProOverlayPlayer(QMainWindow, PlayerLogic, PlaylistViewMixin, UIEventsMixi
         self.apply_panel_shadow(self.overlay.panel, blur=26, offset_y=8)
 
         self.title_bar.setStyleSheet(TITLE_BAR_STYLE)
-        self.title_bar.min_btn.setIcon(QIcon(icon_minus(18)))
-        self.title_bar.max_btn.setIcon(QIcon(icon_maximize(18)))
-        self.title_bar.close_btn.setIcon(QIcon(icon_close(18)))
+        self.title_bar.min_btn.setIcon(self._icon("minus", 18))
+        self.title_bar.max_btn.setIcon(self._icon("maximize", 18))
+        self.title_bar.close_btn.setIcon(self._icon("close", 18))
         # No shadow needed as we have a gradient bg
 
         self.prev_btn = IconButton(parent=self)
@@ -628,19 +717,19 @@ class ProOverlayPlayer(QMainWindow, PlayerLogic, PlaylistViewMixin, UIEventsMixi
 
         self.playlist_btn = IconButton(tooltip=tr("Toggle playlist"), parent=self)
         self.playlist_btn.clicked.connect(self.toggle_playlist_panel)
-        self.playlist_btn.setIcon(QIcon(icon_playlist(22)))
+        self.playlist_btn.setIcon(self._icon("playlist", 22))
 
         self.fullscreen_btn = IconButton(tooltip=tr("Toggle fullscreen"), parent=self)
         self.fullscreen_btn.clicked.connect(self.toggle_fullscreen)
-        self.fullscreen_btn.setIcon(QIcon(icon_fullscreen(22)))
+        self.fullscreen_btn.setIcon(self._icon("fullscreen", 22))
 
         self.add_main_btn = IconButton(tooltip=tr("Add content"), parent=self)
-        self.add_main_btn.setIcon(QIcon(icon_plus(22)))
+        self.add_main_btn.setIcon(self._icon("plus", 22))
         self.add_main_btn.clicked.connect(self.show_add_menu_main)
 
         self.settings_btn = IconButton(tooltip=tr("Settings"), parent=self)
         self.settings_btn.clicked.connect(self.show_settings_menu)
-        self.settings_btn.setIcon(QIcon(icon_settings(22)))
+        self.settings_btn.setIcon(self._icon("settings", 22))
 
         self.mute_btn = IconButton(tooltip=tr("Volume"), parent=self)
         self.mute_btn.clicked.connect(self.toggle_volume_popup)
@@ -1098,19 +1187,36 @@ class ProOverlayPlayer(QMainWindow, PlayerLogic, PlaylistViewMixin, UIEventsMixi
         controls.setSpacing(8) # Increased spacing
         controls.setContentsMargins(4, 8, 4, 4) # Add some breathability
 
-        self.shuffle_btn = IconButton(tooltip=tr("Shuffle"), checkable=True, parent=self)
-        self.shuffle_btn.clicked.connect(self.toggle_shuffle)
-        self.shuffle_btn.setIcon(QIcon(icon_shuffle(22)))
-        self.repeat_btn = IconButton(tooltip=tr("Repeat mode"), parent=self)
-        self.repeat_btn.clicked.connect(self.cycle_repeat_mode)
-        self.repeat_btn.setIcon(QIcon(icon_repeat(22)))
-        self.add_btn = IconButton(tooltip=tr("Add content"), parent=self)
-        self.add_btn.setIcon(QIcon(icon_plus(22)))
-
-        self.search_btn = IconButton(tooltip=tr("Search playlist"), parent=self)
-        self.search_btn.clicked.connect(self.toggle_playlist_search)
-        self.search_btn.setIcon(QIcon(icon_search(22)))
-        self.search_btn.setCheckable(True)
+        # attr, tooltip, icon key (name, *state), click slot, checkable
+        playlist_buttons = (
+            ("shuffle_btn", "Shuffle", ("shuffle", False), self.toggle_shuffle, True),
+            ("repeat_btn", "Repeat mode", ("repeat", False, False), self.cycle_repeat_mode, False),
+            ("add_btn", "Add content", ("plus",), self.show_add_menu, False),
+            ("search_btn", "Search playlist", ("search",), self.toggle_playlist_search, True),
+            ("open_playlist_btn", "Open M3U Playlist", ("open_folder",), self.load_playlist_m3u, False),
+            ("save_playlist_btn", "Save M3U Playlist", ("save",), self.save_playlist_m3u, False),
+            (
+                "restore_session_btn",
+                "Restore last session playlist",
+                ("restore_playlist",),
+                self.restore_session_playlist,
+                False,
+            ),
+            ("remove_btn", "Remove from playlist", ("minus",), self.remove_selected_from_playlist, False),
+            ("sort_btn", "Sort Playlist", ("sort",), self.show_sort_menu, False),
+            (
+                "delete_file_btn",
+                "Delete file to recycle bin",
+                ("trash",),
+                self.delete_selected_file_to_trash,
+                False,
+            ),
+        )
+        for attr, tooltip, (icon_name, *icon_state), slot, checkable in playlist_buttons:
+            btn = IconButton(tooltip=tr(tooltip), checkable=checkable, parent=self)
+            btn.setIcon(self._icon(icon_name, 22, *icon_state))
+            btn.clicked.connect(slot)
+            setattr(self, attr, btn)
 
         self.playlist_search_input = QLineEdit(self.playlist_overlay.panel)
         self.playlist_search_input.setPlaceholderText(tr("Search in playlist..."))
@@ -1119,45 +1225,8 @@ class ProOverlayPlayer(QMainWindow, PlayerLogic, PlaylistViewMixin, UIEventsMixi
         self.playlist_search_input.setVisible(False)
         self.playlist_search_input.textChanged.connect(self.schedule_playlist_filter)
 
-        self.add_menu = QMenu(self)
-        self.add_menu.setStyleSheet(MENU_STYLE)
-        
-        file_act = self.add_menu.addAction(tr("File"))
-        file_act.triggered.connect(self.add_files_dialog)
-        
-        folder_act = self.add_menu.addAction(tr("Folder"))
-        folder_act.triggered.connect(self.add_folder_dialog)
-        
-        url_act = self.add_menu.addAction(tr("URL"))
-        url_act.triggered.connect(self.open_url_dialog)
-        
-        self.add_btn.clicked.connect(self.show_add_menu)
-
-        self.open_playlist_btn = IconButton(tooltip=tr("Open M3U Playlist"), parent=self)
-        self.open_playlist_btn.clicked.connect(self.load_playlist_m3u)
-        self.open_playlist_btn.setIcon(QIcon(icon_open_folder(22)))
-
-        self.save_playlist_btn = IconButton(tooltip=tr("Save M3U Playlist"), parent=self)
-        self.save_playlist_btn.clicked.connect(self.save_playlist_m3u)
-        self.save_playlist_btn.setIcon(QIcon(icon_save(22)))
-
-        self.restore_session_btn = IconButton(tooltip=tr("Restore last session playlist"), parent=self)
-        self.restore_session_btn.clicked.connect(self.restore_session_playlist)
-        self.restore_session_btn.setIcon(QIcon(icon_restore_playlist(22)))
-
-
-        self.remove_btn = IconButton(tooltip=tr("Remove from playlist"), parent=self)
-        self.remove_btn.clicked.connect(self.remove_selected_from_playlist)
-        self.remove_btn.setIcon(QIcon(icon_minus(22)))
-
-        self.sort_btn = IconButton(tooltip=tr("Sort Playlist"), parent=self)
-        self.sort_btn.clicked.connect(self.show_sort_menu)
-        self.sort_btn.setIcon(QIcon(icon_sort(22)))
-
-
-        self.delete_file_btn = IconButton(tooltip=tr("Delete file to recycle bin"), parent=self)
-        self.delete_file_btn.clicked.connect(self.delete_selected_file_to_trash)
-        self.delete_file_btn.setIcon(QIcon(icon_trash(22)))
+        # Built on first use; see _ensure_add_menu.
+        self.add_menu = None
 
         controls.setSpacing(2)
         controls.addWidget(self.search_btn)
@@ -1184,6 +1253,23 @@ class ProOverlayPlayer(QMainWindow, PlayerLogic, PlaylistViewMixin, UIEventsMixi
         
         layout.addLayout(controls)
         self.update_mode_buttons()
+        self._prewarm_icon_cache()
+
+    def _ensure_add_menu(self) -> QMenu:
+        if self.add_menu is not None:
+            return self.add_menu
+        self.add_menu = QMenu(self)
+        self.add_menu.setStyleSheet(MENU_STYLE)
+
+        file_act = self.add_menu.addAction(tr("File"))
+        file_act.triggered.connect(self.add_files_dialog)
+
+        folder_act = self.add_menu.addAction(tr("Folder"))
+        folder_act.triggered.connect(self.add_folder_dialog)
+
+        url_act = self.add_menu.addAction(tr("URL"))
+        url_act.triggered.connect(self.open_url_dialog)
+        return self.add_menu
 
     def get_current_media_source(self) -> str:
         if not self.playlist or not (0 <= self.current_index < len(self.playlist)):
@@ -1279,6 +1365,11 @@ class ProOverlayPlayer(QMainWindow, PlayerLogic, PlaylistViewMixin, UIEventsMixi
             self.player.sub_add(subtitle_path)
         return str(target_path)
 
+    def _create_managed_timer(self) -> QTimer:
+        timer = QTimer(self)
+        self._managed_timers.append(timer)
+        return timer
+
     def closeEvent(self, event):
         if self._is_shutting_down:
             event.accept()
@@ -1309,27 +1400,17 @@ class ProOverlayPlayer(QMainWindow, PlayerLogic, PlaylistViewMixin, UIEventsMixi
         self._save_session_playlist_snapshot()
         
         # Stop timers
-        if hasattr(self, "mouse_timer"):
-            self.mouse_timer.stop()
-        if hasattr(self, "ui_timer"):
-            self.ui_timer.stop()
-        if hasattr(self, "_append_chunk_timer"):
-            self._append_chunk_timer.stop()
-        if hasattr(self, "_import_status_timer"):
-            self._import_status_timer.stop()
-        if hasattr(self, "_url_status_timer"):
-            self._url_status_timer.stop()
+        for timer in self._managed_timers:
+            timer.stop()
         self._stop_import_progress()
         self._stop_url_resolve_status()
         self._shutdown_background_workers()
         self._clear_seek_thumbnail_temp_dir()
 
         # Explicitly close and delete all overlay windows
-        for attr in ["overlay", "speed_overlay", "playlist_overlay", "title_bar"]:
-            if hasattr(self, attr):
-                win = getattr(self, attr)
-                win.close()
-                win.deleteLater()
+        for win in self._managed_overlays:
+            win.close()
+            win.deleteLater()
 
         app = QApplication.instance()
         if app:
@@ -1346,6 +1427,12 @@ class ProOverlayPlayer(QMainWindow, PlayerLogic, PlaylistViewMixin, UIEventsMixi
         url_worker = self._active_url_worker
         prepare_worker = self._active_prepare_worker
         scanners = list(self.scanners)
+        aux_workers = list(self._drop_triage_workers) + list(self._m3u_io_workers)
+        self._drop_triage_workers.clear()
+        self._m3u_io_workers.clear()
+        if self._startup_collect_worker is not None:
+            aux_workers.append(self._startup_collect_worker)
+            self._startup_collect_worker = None
 
         self._active_url_worker = None
         self._active_url_request = None
@@ -1357,7 +1444,9 @@ class ProOverlayPlayer(QMainWindow, PlayerLogic, PlaylistViewMixin, UIEventsMixi
 
         self.scanners.clear()
         self._pending_duration_paths.clear()
+        self._pending_duration_set.clear()
         self._pending_model_appends.clear()
+        self._pending_duration_updates.clear()
 
         if url_worker is not None:
             try:
@@ -1381,6 +1470,17 @@ class ProOverlayPlayer(QMainWindow, PlayerLogic, PlaylistViewMixin, UIEventsMixi
             except (RuntimeError, TypeError):
                 pass
 
+        for worker in aux_workers:
+            try:
+                worker.disconnect()
+            except (RuntimeError, TypeError):
+                pass
+            try:
+                worker.requestInterruption()
+                worker.quit()
+            except (RuntimeError, TypeError):
+                pass
+
         for scanner in scanners:
             try:
                 scanner.disconnect()
@@ -1410,31 +1510,18 @@ class ProOverlayPlayer(QMainWindow, PlayerLogic, PlaylistViewMixin, UIEventsMixi
         return True
 
     def _apply_stream_auth_header_for_current(self, current_file) -> None:
-        try:
-            parsed = urlparse(str(current_file))
-            if parsed.scheme in {"http", "https"} and parsed.netloc:
-                host = parsed.netloc.split("@")[-1].lower()
-                auth_value = self._stream_auth_by_host.get(host)
-                if auth_value:
-                    self._set_mpv_property_safe(
-                        "http_header_fields",
-                        f"Authorization: {auth_value}",
-                        allow_during_busy=True,
-                    )
-                else:
-                    self._set_mpv_property_safe(
-                        "http_header_fields",
-                        "",
-                        allow_during_busy=True,
-                    )
-            else:
-                self._set_mpv_property_safe(
-                    "http_header_fields",
-                    "",
-                    allow_during_busy=True,
-                )
-        except (TypeError, ValueError):
-            pass
+        source = str(current_file)
+        header = ""
+        # Local files are the common case and can never carry an auth header.
+        if source[:7].lower() == "http://" or source[:8].lower() == "https://":
+            host = _http_auth_host(source)
+            auth_value = self._stream_auth_by_host.get(host) if host else None
+            if auth_value:
+                header = f"Authorization: {auth_value}"
+        if header == self._applied_http_header:
+            return
+        if self._set_mpv_property_safe("http_header_fields", header, allow_during_busy=True):
+            self._applied_http_header = header
 
     def _apply_seek_profile_for_source(self, current_file) -> None:
         source = str(current_file or "")
@@ -1537,6 +1624,8 @@ class ProOverlayPlayer(QMainWindow, PlayerLogic, PlaylistViewMixin, UIEventsMixi
             self.time_label.setText(f"00:00 / {format_duration(known_duration)}")
         else:
             self.time_label.setText("00:00 / 00:00")
+        self._time_label_key = None
+        self._timeline_key = None
         self.update_transport_icons()
         self.sync_shuffle_pos_to_current()
         QTimer.singleShot(
@@ -1547,37 +1636,23 @@ class ProOverlayPlayer(QMainWindow, PlayerLogic, PlaylistViewMixin, UIEventsMixi
         )
 
     def _display_name_for_track(self, current_file) -> str:
-        display_name = str(self.playlist_titles.get(str(current_file), "")).strip()
+        source = str(current_file)
+        display_name = str(self.playlist_titles.get(source, "")).strip()
         if display_name:
             if not (
-                _is_youtube_url(str(current_file))
+                _is_youtube_url(source)
                 and display_name.casefold() in {"watch", "youtube", "youtube?", "video", "untitled", "unknown"}
             ):
                 return display_name
-        try:
-            if is_archive_member_source(str(current_file)):
-                archive_path, member_name = parse_archive_member_source(str(current_file))
-                archive_label = Path(archive_path).name if archive_path else ""
-                member_label = Path(member_name).name if member_name else "Archive item"
-                return f"{member_label} [{archive_label}]" if archive_label else member_label
-            parsed = urlparse(str(current_file))
-            if parsed.scheme and parsed.netloc:
-                if _is_youtube_url(str(current_file)):
-                    direct_yt = _youtube_direct_video_url(str(current_file))
-                    if direct_yt:
-                        vid = parse_qs(urlparse(direct_yt).query).get("v", [""])[0]
-                        return f"YouTube {vid}" if vid else "YouTube"
-                    return "YouTube"
-                return unquote(Path(parsed.path.rstrip("/")).name) or parsed.netloc
-            return Path(str(current_file)).name
-        except (TypeError, ValueError):
-            return str(current_file)
+        return _fallback_track_display_name(source)
 
     def _update_window_title_for_track(self, current_file) -> None:
         display_name = self._display_name_for_track(current_file)
         title = f"[{self.current_index + 1}/{len(self.playlist)}] {display_name}"
-        self.setWindowTitle(title)
-        if hasattr(self, "title_bar"):
+        # Title changes go to the window manager synchronously; skip identical ones.
+        if title != self.windowTitle():
+            self.setWindowTitle(title)
+        if self.title_bar is not None and title != self.title_bar.info_label.text():
             self.title_bar.info_label.setText(title)
 
     def _schedule_resume_and_chapter_refresh(self, current_file, load_token: int) -> None:
@@ -1698,13 +1773,15 @@ class ProOverlayPlayer(QMainWindow, PlayerLogic, PlaylistViewMixin, UIEventsMixi
         self._last_duration = 0.0
         self._last_progress_time = 0.0
         self.time_label.setText("00:00 / 00:00")
+        self._time_label_key = None
+        self._timeline_key = None
         self.seek_slider.setValue(0)
         self.seek_slider.setRange(0, 0)
         self.seek_slider.set_current_time(0.0)
         self.seek_slider.set_chapters([])
         self.update_transport_icons()
         self.setWindowTitle("Cadre Player")
-        if hasattr(self, "title_bar"):
+        if self.title_bar is not None:
             self.title_bar.info_label.setText("")
         self.sync_size()
 
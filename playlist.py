@@ -3,15 +3,25 @@ import subprocess
 import logging
 import time
 import base64
+import gzip
+import io
 import re
+import stat
+import threading
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional
 from urllib.error import HTTPError, URLError
 from urllib.parse import parse_qs, quote, unquote, urljoin, urlparse, urlsplit, urlunsplit
-from urllib.request import Request, urlopen
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
 from xml.etree import ElementTree as ET
 
-from PySide6.QtCore import QItemSelectionModel, QPoint, QTimer, QUrl
+from PySide6.QtCore import QItemSelectionModel, QPoint, Qt, QTimer, QUrl
 from PySide6.QtCore import QThread, Signal
 from PySide6.QtGui import QAction
 from PySide6.QtWidgets import QAbstractItemView, QFileDialog, QMenu, QMessageBox
@@ -22,8 +32,10 @@ from .ui.styles import MENU_STYLE
 from .utils import (
     AUDIO_EXTENSIONS,
     ARCHIVE_EXTENSIONS,
+    ARCHIVE_EXTENSION_SET,
     VIDEO_EXTENSIONS,
     collect_paths,
+    collect_paths_with_exts,
     delete_to_trash as util_delete_to_trash,
     format_duration,
     get_user_data_path,
@@ -45,6 +57,11 @@ except Exception:
     yt_dlp = None
 
 YTDLP_REMOTE_COMPONENTS = "ejs:github"
+_ANSI_ESCAPE_RE = re.compile(r"\x1b\[[0-9;]*m")
+_YTDLP_ERROR_PREFIX_RE = re.compile(r"^ERROR:\s*", re.IGNORECASE)
+_YTDLP_EXTRACTOR_TAG_RE = re.compile(r"^\[[^\]]+\]\s*")
+# scheme, optional userinfo, then host[:port] -- same host key as urlparse().netloc minus credentials.
+_HTTP_AUTH_HOST_RE = re.compile(r"^https?://(?:[^/?#]*@)?([^/?#]+)", re.IGNORECASE)
 
 
 def _build_ytdlp_opts(extra: Optional[dict] = None) -> dict:
@@ -59,15 +76,72 @@ def _build_ytdlp_opts(extra: Optional[dict] = None) -> dict:
     return opts
 
 
-def normalize_playlist_entry(value) -> tuple[str, str]:
+_YTDLP_INFO_TTL_SEC = 600.0
+_YTDLP_INFO_CACHE_LIMIT = 128
+_YTDLP_INFO_CACHE: dict[tuple, tuple[float, dict]] = {}
+_ytdlp_info_lock = threading.Lock()
+
+
+def _cached_extract_info(url: str, opts: dict):
+    # yt-dlp metadata requests are multi-second network work; reuse recent results per URL/options.
+    key = (str(url), tuple(sorted((k, repr(v)) for k, v in opts.items())))
+    now = time.monotonic()
+    with _ytdlp_info_lock:
+        hit = _YTDLP_INFO_CACHE.get(key)
+        if hit is not None and hit[0] > now:
+            return hit[1]
+    with yt_dlp.YoutubeDL(opts) as ydl:
+        info = ydl.extract_info(url, download=False)
+    if isinstance(info, dict):
+        with _ytdlp_info_lock:
+            _YTDLP_INFO_CACHE.pop(key, None)
+            _YTDLP_INFO_CACHE[key] = (now + _YTDLP_INFO_TTL_SEC, info)
+            while len(_YTDLP_INFO_CACHE) > _YTDLP_INFO_CACHE_LIMIT:
+                _YTDLP_INFO_CACHE.pop(next(iter(_YTDLP_INFO_CACHE)), None)
+    return info
+
+
+def _apply_duration_map(duration_map: dict, raw_durations: dict, formatted_durations: dict):
+    for path, seconds in duration_map.items():
+        # Parsed maps already hold floats; only odd values pay for the conversion attempt.
+        if isinstance(seconds, float):
+            sec = seconds
+        else:
+            try:
+                sec = float(seconds)
+            except (TypeError, ValueError):
+                continue
+        raw_durations[path] = sec
+        formatted_durations[path] = format_duration(sec)
+
+
+@lru_cache(maxsize=4096)
+def _http_auth_host(url: str) -> str:
+    # Looked up on every track switch; the host for a given URL never changes.
+    match = _HTTP_AUTH_HOST_RE.match(url)
+    return match.group(1).lower() if match else ""
+
+
+def normalize_playlist_entry(value, cwd: Optional[str] = None) -> tuple[str, str]:
     raw = str(value).strip()
+    # Relative results depend on the working directory, so it is part of the cache key.
+    if os.path.isabs(raw):
+        cwd = None
+    elif cwd is None:
+        cwd = os.getcwd()
+    return _normalize_playlist_entry_cached(raw, cwd)
+
+
+@lru_cache(maxsize=16384)
+def _normalize_playlist_entry_cached(raw: str, cwd: Optional[str]) -> tuple[str, str]:
     if is_archive_member_source(raw):
-        return raw, raw.casefold()
+        return raw, raw.lower()
     if _is_stream_url(raw):
-        return raw, raw.casefold()
-    abs_path = os.path.abspath(raw)
-    key = os.path.normcase(os.path.normpath(abs_path))
-    return abs_path, key
+        return raw, raw.lower()
+    # Same result as abspath() but without a getcwd() call per entry in batch imports.
+    abs_path = os.path.normpath(raw if cwd is None else os.path.join(cwd, raw))
+    # abspath/normpath output is already normalized; only case folding remains.
+    return abs_path, os.path.normcase(abs_path)
 
 
 def parse_local_m3u_with_meta(path: str) -> tuple[list[str], dict[str, str], dict[str, float]]:
@@ -131,16 +205,46 @@ def parse_local_m3u(path: str) -> list[str]:
     return items
 
 
+@lru_cache(maxsize=4096)
 def _looks_like_m3u_url(url: str) -> bool:
     lower = str(url or "").split("?", 1)[0].split("#", 1)[0].lower()
     return lower.endswith(".m3u") or lower.endswith(".m3u8")
 
 
+_SUBTITLE_EXTS = frozenset({".srt", ".ass", ".ssa", ".sub", ".vtt"})
+
+
+@lru_cache(maxsize=2)
+def _media_filter_string(include_audio: bool) -> str:
+    # Translated; change_language clears this cache.
+    video_globs = " ".join(f"*{ext}" for ext in VIDEO_EXTENSIONS)
+    audio_globs = " ".join(f"*{ext}" for ext in AUDIO_EXTENSIONS)
+    archive_globs = " ".join(f"*{ext}" for ext in ARCHIVE_EXTENSIONS)
+    if include_audio:
+        return ";;".join(
+            (
+                tr("Media Files ({})").format(f"{video_globs} {audio_globs} {archive_globs}"),
+                tr("Video Files ({})").format(video_globs),
+                tr("Audio Files ({})").format(audio_globs),
+                tr("Archives ({})").format(archive_globs),
+                tr("All files (*.*)"),
+            )
+        )
+    return ";;".join(
+        (
+            tr("Video Files ({})").format(f"{video_globs} {archive_globs}"),
+            tr("Archives ({})").format(archive_globs),
+            tr("All files (*.*)"),
+        )
+    )
+
+
 def _looks_like_m3u_path(path: str) -> bool:
     lower = str(path or "").strip().lower()
     return lower.endswith(".m3u") or lower.endswith(".m3u8")
 
 
+@lru_cache(maxsize=4096)
 def _is_youtube_url(url: str) -> bool:
     host = (urlparse(url).netloc or "").lower()
     return any(h in host for h in ("youtube.com", "youtu.be", "music.youtube.com"))
@@ -234,9 +338,9 @@ def _short_youtube_error_message(err: str) -> str:
     text = str(err or "").strip()
     if not text:
         return "could not access YouTube video"
-    text = re.sub(r"\x1b\[[0-9;]*m", "", text)
-    text = re.sub(r"^ERROR:\s*", "", text, flags=re.IGNORECASE)
-    text = re.sub(r"^\[[^\]]+\]\s*", "", text).strip()
+    text = _ANSI_ESCAPE_RE.sub("", text)
+    text = _YTDLP_ERROR_PREFIX_RE.sub("", text)
+    text = _YTDLP_EXTRACTOR_TAG_RE.sub("", text).strip()
     lower = text.casefold()
     if "members" in lower and "only" in lower:
         return "members-only YouTube video"
@@ -264,8 +368,7 @@ def _extract_youtube_single_metadata(url: str) -> tuple[str, float | None, str]:
                 "extract_flat": False,
             }
         )
-        with yt_dlp.YoutubeDL(opts) as ydl:
-            info = ydl.extract_info(url, download=False)
+        info = _cached_extract_info(url, opts)
         if isinstance(info, dict):
             title = str(info.get("title") or "").strip()
             try:
@@ -315,19 +418,28 @@ def _sanitize_http_url(url: str) -> str:
         return raw
 
 
-def _parse_m3u_text(text: str, base_url: str) -> list[str]:
+def _parse_m3u_text(body: bytes, base_url: str) -> list[str]:
+    # Work on raw bytes so comment/#EXTINF lines are skipped without being decoded.
     items = []
     seen = set()
-    for raw_line in text.splitlines():
+    if body.startswith(b"\xef\xbb\xbf"):
+        body = body[3:]
+    for raw_line in body.splitlines():
         line = raw_line.strip()
-        if not line or line.startswith("#"):
+        if not line or line[:1] == b"#":
             continue
-        if "://" not in line:
-            line = urljoin(base_url, line)
-        key = line.casefold()
-        if key not in seen:
-            seen.add(key)
-            items.append(line)
+        if b"://" in line:
+            key = line.lower()
+            if key in seen:
+                continue
+            entry = line.decode("utf-8", errors="replace")
+        else:
+            entry = urljoin(base_url, line.decode("utf-8", errors="replace"))
+            key = entry.encode("utf-8").lower()
+            if key in seen:
+                continue
+        seen.add(key)
+        items.append(entry)
     return items
 
 
@@ -340,32 +452,177 @@ def _auth_header(auth: Optional[dict]) -> Optional[str]:
     password = str(auth.get("password") or "")
     if not username:
         return None
+    return _basic_auth_value(username, password)
+
+
+@lru_cache(maxsize=32)
+def _basic_auth_value(username: str, password: str) -> str:
     token = f"{username}:{password}".encode("utf-8")
     return "Basic " + base64.b64encode(token).decode("ascii")
 
 
-def _fetch_remote_m3u(url: str, auth: Optional[dict] = None) -> list[str]:
+_HTTP_USER_AGENT = "CadrePlayer/1.0 (+https://github.com/)"
+_HTTP_MAX_REDIRECTS = 5
+_WEBDAV_MAX_WORKERS = 8
+_DAV_RESPONSE = "{DAV:}response"
+_DAV_HREF = "{DAV:}href"
+_DAV_COLLECTION = "{DAV:}collection"
+_PROGRESS_EMIT_INTERVAL_SEC = 0.1
+_YOUTUBE_RESOLVE_WORKERS = 4
+
+
+class _HTTPConnectionPool:
+    # Idle keep-alive connections per host, shared by one resolve job and closed when it ends.
+    # A connection is checked out by one thread at a time; http.client objects are not thread-safe.
+
+    def __init__(self):
+        self._idle: dict[tuple[str, str], list] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @staticmethod
+    def connect(scheme: str, netloc: str, timeout: float):
+        conn_cls = HTTPSConnection if scheme == "https" else HTTPConnection
+        return conn_cls(netloc, timeout=timeout)
+
+    def acquire(self, scheme: str, netloc: str, timeout: float):
+        # Returns (connection, reused); only a reused connection can have gone stale.
+        key = (scheme, netloc.lower())
+        with self._lock:
+            idle = self._idle.get(key)
+            conn = idle.pop() if idle else None
+        if conn is None:
+            return self.connect(scheme, netloc, timeout), False
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+
+    def release(self, scheme: str, netloc: str, conn) -> None:
+        with self._lock:
+            if not self._closed:
+                self._idle.setdefault((scheme, netloc.lower()), []).append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+
+def _uses_proxy(parts) -> bool:
+    if parts.scheme not in getproxies():
+        return False
+    return not proxy_bypass(parts.hostname or "")
+
+
+def _http_request(
+    method: str,
+    url: str,
+    *,
+    headers: dict,
+    data: Optional[bytes] = None,
+    timeout: float = 6,
+    pool: Optional[_HTTPConnectionPool] = None,
+):
+    # Returns (final_url, headers, body). Without a pool, or through a proxy, this is plain urlopen.
+    parts = urlsplit(url)
+    if pool is None or parts.scheme not in {"http", "https"} or _uses_proxy(parts):
+        req = Request(url, method=method, data=data, headers=headers)
+        with urlopen(req, timeout=timeout) as resp:
+            return resp.geturl(), resp.headers, resp.read()
+
+    for _ in range(_HTTP_MAX_REDIRECTS + 1):
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+        conn, reused = pool.acquire(parts.scheme, parts.netloc, timeout)
+        while True:
+            try:
+                conn.request(method, target, body=data, headers=headers)
+                resp = conn.getresponse()
+                body = resp.read()
+            except TimeoutError as e:
+                conn.close()
+                raise URLError(e) from e
+            except (HTTPException, ConnectionError) as e:
+                conn.close()
+                if not reused:
+                    raise URLError(e) from e
+                # The server may have closed an idle keep-alive socket; retry once on a new connection.
+                conn, reused = pool.connect(parts.scheme, parts.netloc, timeout), False
+                continue
+            except OSError as e:
+                conn.close()
+                raise URLError(e) from e
+            break
+        if resp.will_close:
+            conn.close()
+        else:
+            pool.release(parts.scheme, parts.netloc, conn)
+
+        location = resp.getheader("Location")
+        if resp.status in (301, 302, 303, 307, 308) and location:
+            url = urljoin(url, location)
+            parts = urlsplit(url)
+            if parts.scheme not in {"http", "https"}:
+                raise URLError(f"unsupported redirect target: {url}")
+            if _uses_proxy(parts):
+                req = Request(url, method=method, data=data, headers=headers)
+                with urlopen(req, timeout=timeout) as resp:
+                    return resp.geturl(), resp.headers, resp.read()
+            if resp.status == 303 or (resp.status in (301, 302) and method == "POST"):
+                method, data = "GET", None
+            continue
+        if resp.status >= 400:
+            raise HTTPError(url, resp.status, resp.reason, resp.headers, io.BytesIO(body))
+        return url, resp.headers, body
+    raise URLError(f"too many redirects: {url}")
+
+
+def _decode_content_encoding(body: bytes, encoding: Optional[str]) -> bytes:
+    token = str(encoding or "").strip().lower()
+    if token in {"gzip", "x-gzip"}:
+        return gzip.decompress(body)
+    if token == "deflate":
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            # Some servers send raw deflate without the zlib header.
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
+
+
+def _fetch_remote_m3u(
+    url: str,
+    auth: Optional[dict] = None,
+    pool: Optional[_HTTPConnectionPool] = None,
+) -> list[str]:
     safe_url = _sanitize_http_url(url)
     headers = {
-        "User-Agent": "CadrePlayer/1.0 (+https://github.com/)",
+        "User-Agent": _HTTP_USER_AGENT,
         "Accept": "application/x-mpegURL, audio/mpegurl, text/plain, */*",
+        "Accept-Encoding": "gzip, deflate",
     }
     auth_value = _auth_header(auth)
     if auth_value:
         headers["Authorization"] = auth_value
-    req = Request(safe_url, headers=headers)
-    with urlopen(req, timeout=6) as resp:
-        body = resp.read()
-    text = body.decode("utf-8-sig", errors="replace")
-    items = _parse_m3u_text(text, safe_url)
+    _, resp_headers, body = _http_request("GET", safe_url, headers=headers, timeout=6, pool=pool)
+    body = _decode_content_encoding(body, resp_headers.get("Content-Encoding"))
+    items = _parse_m3u_text(body, safe_url)
     if items:
         return items
-    probe = text.lstrip().lower()
-    if probe.startswith("<?xml") or "<html" in probe[:300]:
+    probe = body.lstrip(b"\xef\xbb\xbf \t\r\n").lower()
+    if probe.startswith(b"<?xml") or b"<html" in probe[:300]:
         raise ValueError("URL did not return an M3U playlist")
     raise ValueError("Remote playlist is empty or invalid")
 
 
+@lru_cache(maxsize=4096)
 def _looks_like_directory_stream_url(url: str) -> bool:
     try:
         parsed = urlparse(url)
@@ -382,62 +639,87 @@ def _looks_like_directory_stream_url(url: str) -> bool:
         return False
 
 
-def _fetch_webdav_listing(url: str, auth: Optional[dict] = None) -> tuple[list[str], list[str]]:
+def _fetch_webdav_listing(
+    url: str,
+    auth: Optional[dict] = None,
+    pool: Optional[_HTTPConnectionPool] = None,
+) -> tuple[list[str], list[str]]:
     safe_url = _sanitize_http_url(url)
     if not safe_url.endswith("/"):
         safe_url += "/"
     headers = {
         "Depth": "1",
-        "User-Agent": "CadrePlayer/1.0 (+https://github.com/)",
+        "User-Agent": _HTTP_USER_AGENT,
+        "Content-Type": "application/xml; charset=utf-8",
     }
     auth_value = _auth_header(auth)
     if auth_value:
         headers["Authorization"] = auth_value
-    req = Request(
+    _, _, body = _http_request(
+        "PROPFIND",
         safe_url,
-        method="PROPFIND",
+        headers=headers,
         data=(
             b'<?xml version="1.0" encoding="utf-8"?><d:propfind xmlns:d="DAV:">'
             b"<d:prop><d:resourcetype/><d:getcontenttype/></d:prop></d:propfind>"
         ),
-        headers=headers,
+        timeout=8,
+        pool=pool,
     )
-    with urlopen(req, timeout=8) as resp:
-        body = resp.read()
-    root = ET.fromstring(body)
-    ns = {"d": "DAV:"}
     files, dirs = [], []
-    base_path = urlparse(safe_url).path.rstrip("/")
-    for response in root.findall(".//d:response", ns):
-        href = response.findtext("d:href", default="", namespaces=ns)
-        if not href:
-            continue
-        full = urljoin(safe_url, href)
+    parsed_base = urlparse(safe_url)
+    base_path = parsed_base.path.rstrip("/")
+    origin = f"{parsed_base.scheme}://{parsed_base.netloc}"
+
+    def _add_response(href: str, is_collection: bool):
+        # Servers almost always return absolute paths; only odd hrefs need a full urljoin.
+        if href.startswith("/") and not href.startswith("//"):
+            full = origin + href
+        elif "://" in href:
+            full = href
+        else:
+            full = urljoin(safe_url, href)
         full = _sanitize_http_url(full)
         parsed = urlparse(full)
         rel_path = parsed.path
         if rel_path.rstrip("/") == base_path.rstrip("/"):
-            continue
-        is_collection = response.find(".//d:collection", ns) is not None
+            return
         if is_collection:
             if not full.endswith("/"):
                 full += "/"
             dirs.append(full)
-            continue
+            return
         ext = Path(unquote(parsed.path)).suffix.lower()
         if ext in VIDEO_EXTENSIONS or ext in AUDIO_EXTENSIONS or ext in ARCHIVE_EXTENSIONS:
             files.append(full)
+
+    # Stream the multistatus body; each <response> is handled and cleared as soon as it closes.
+    href = ""
+    is_collection = False
+    for _, elem in ET.iterparse(io.BytesIO(body), events=("end",)):
+        tag = elem.tag
+        if tag == _DAV_HREF:
+            if not href:
+                href = elem.text or ""
+        elif tag == _DAV_COLLECTION:
+            is_collection = True
+        elif tag == _DAV_RESPONSE:
+            if href:
+                _add_response(href, is_collection)
+            href = ""
+            is_collection = False
+            elem.clear()
     seen = set()
     files_unique = []
     for item in files:
-        key = item.casefold()
+        key = item.lower()
         if key not in seen:
             seen.add(key)
             files_unique.append(item)
     seen_dirs = set()
     dirs_unique = []
     for item in dirs:
-        key = item.casefold()
+        key = item.lower()
         if key not in seen_dirs:
             seen_dirs.add(key)
             dirs_unique.append(item)
@@ -450,33 +732,44 @@ def _fetch_webdav_files_recursive(
     *,
     max_dirs: int = 400,
     max_files: int = 20000,
+    max_workers: int = _WEBDAV_MAX_WORKERS,
+    pool: Optional[_HTTPConnectionPool] = None,
 ) -> list[str]:
     start = _sanitize_http_url(root_url)
     if not start.endswith("/"):
         start += "/"
-    pending = [start]
-    seen_dirs = {start.casefold()}
+    pending = deque([start])
+    seen_dirs = {start.lower()}
     all_files = []
-    while pending:
-        current = pending.pop(0)
-        try:
-            level_files, level_dirs = _fetch_webdav_listing(current, auth=auth)
-        except HTTPError:
-            raise
-        except Exception:
-            continue
-        for f in level_files:
-            all_files.append(f)
-            if len(all_files) >= max_files:
-                return all_files
-        for d in level_dirs:
-            key = d.casefold()
-            if key in seen_dirs:
-                continue
-            if len(seen_dirs) >= max_dirs:
-                continue
-            seen_dirs.add(key)
-            pending.append(d)
+    workers = max(1, int(max_workers))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while pending:
+            # Fan out one wave of PROPFINDs, then merge results in submission order.
+            wave = [pending.popleft() for _ in range(min(workers, len(pending)))]
+            futures = [executor.submit(_fetch_webdav_listing, current, auth, pool) for current in wave]
+            try:
+                for future in futures:
+                    try:
+                        level_files, level_dirs = future.result()
+                    except HTTPError:
+                        raise
+                    except Exception:
+                        continue
+                    for f in level_files:
+                        all_files.append(f)
+                        if len(all_files) >= max_files:
+                            return all_files
+                    for d in level_dirs:
+                        key = d.lower()
+                        if key in seen_dirs:
+                            continue
+                        if len(seen_dirs) >= max_dirs:
+                            continue
+                        seen_dirs.add(key)
+                        pending.append(d)
+            finally:
+                for future in futures:
+                    future.cancel()
     return all_files
 
 
@@ -484,11 +777,13 @@ def _extract_youtube_entries(url: str) -> tuple[list[dict], str]:
     if yt_dlp is None:
         return ([], "yt-dlp not installed")
     results = []
+    append_result = results.append
+    normalize_url = _normalize_youtube_item_url
 
     def _push_entry(item_url, title=None, duration=None):
         if not item_url:
             return
-        norm_url = _normalize_youtube_item_url(item_url)
+        norm_url = normalize_url(item_url)
         if not norm_url:
             return
         entry = {"url": norm_url}
@@ -499,7 +794,7 @@ def _extract_youtube_entries(url: str) -> tuple[list[dict], str]:
                 entry["duration"] = float(duration)
             except Exception:
                 pass
-        results.append(entry)
+        append_result(entry)
 
     try:
         opts = _build_ytdlp_opts(
@@ -509,8 +804,7 @@ def _extract_youtube_entries(url: str) -> tuple[list[dict], str]:
                 "playlistend": 10000,
             }
         )
-        with yt_dlp.YoutubeDL(opts) as ydl:
-            info = ydl.extract_info(url, download=False)
+        info = _cached_extract_info(url, opts)
     except Exception as e:
         logging.exception("YouTube extract failed: url=%s err=%s", url, e)
         return ([], f"{e}")
@@ -537,8 +831,7 @@ def _extract_youtube_entries(url: str) -> tuple[list[dict], str]:
                 "playlistend": 10000,
             }
         )
-        with yt_dlp.YoutubeDL(opts) as ydl:
-            info2 = ydl.extract_info(url, download=False)
+        info2 = _cached_extract_info(url, opts)
         entries2 = info2.get("entries") if isinstance(info2, dict) else None
         if isinstance(entries2, list):
             for item in entries2:
@@ -566,6 +859,67 @@ def _extract_youtube_entries(url: str) -> tuple[list[dict], str]:
     return ([], "no playable YouTube entries found")
 
 
+def _resolve_youtube_source(url: str) -> tuple[list[str], dict, dict, str]:
+    # Returns (resolved_urls, title_map, duration_map, error); error is set only when nothing resolved.
+    titles = {}
+    durations = {}
+    direct_video = _youtube_direct_video_url(url)
+    if direct_video and not _youtube_looks_like_playlist_url(url):
+        logging.debug("Resolving URL as direct YouTube video: %s", url)
+        yt_title, yt_duration, yt_single_error = _extract_youtube_single_metadata(direct_video)
+        if yt_single_error:
+            logging.warning(
+                "YouTube direct video rejected: url=%s reason=%s",
+                url,
+                yt_single_error,
+            )
+            return [], titles, durations, yt_single_error
+        if yt_title and not _is_placeholder_title(yt_title):
+            titles[direct_video] = yt_title
+        if yt_duration is not None and yt_duration >= 0:
+            durations[direct_video] = float(yt_duration)
+        return [direct_video], titles, durations, ""
+
+    logging.debug("Resolving URL as YouTube extract: %s", url)
+    entries, yt_error = _extract_youtube_entries(url)
+    resolved = []
+    for e in entries:
+        item_url = e.get("url")
+        if not item_url:
+            continue
+        resolved.append(str(item_url))
+        if e.get("title"):
+            titles[str(item_url)] = str(e["title"])
+        if e.get("duration") is not None:
+            try:
+                durations[str(item_url)] = float(e["duration"])
+            except Exception:
+                pass
+    logging.info(
+        "YouTube resolve result: url=%s items=%d error=%s",
+        url,
+        len(resolved),
+        yt_error or "",
+    )
+    if not resolved:
+        return [], titles, durations, yt_error or "no playable YouTube entries found"
+    return resolved, titles, durations, ""
+
+
+def _throttled_progress_emitter(signal, interval_sec: float = _PROGRESS_EMIT_INTERVAL_SEC):
+    # Cross-thread progress signals are capped by time, not item count, to spare the UI loop.
+    last_emit = 0.0
+
+    def emit(count: int):
+        nonlocal last_emit
+        now = time.monotonic()
+        if (now - last_emit) >= interval_sec:
+            last_emit = now
+            signal.emit(count)
+
+    return emit
+
+
 class URLResolveWorker(QThread):
     finished_urls = Signal(list, dict, dict, str, list)
     progress_count = Signal(int)
@@ -590,6 +944,7 @@ class URLResolveWorker(QThread):
                 last_error = str(msg)
 
         self.progress_count.emit(0)
+        emit_progress = _throttled_progress_emitter(self.progress_count)
         logging.info("URL resolve worker started: raw_count=%d", len(self.raw_urls))
 
         def _record_failure(source: str, reason: str):
@@ -603,8 +958,23 @@ class URLResolveWorker(QThread):
             failure_seen.add(key)
             failures.append({"source": src, "reason": msg})
 
+        youtube_executor = None
+        youtube_futures = {}
+        # Keep-alive connections live only as long as this job.
+        http_pool = _HTTPConnectionPool()
         try:
-            for raw in self.raw_urls:
+            youtube_jobs = [
+                (index, str(raw).strip())
+                for index, raw in enumerate(self.raw_urls)
+                if str(raw).strip() and _is_youtube_url(str(raw).strip())
+            ]
+            if len(youtube_jobs) > 1:
+                # Independent yt-dlp lookups run ahead in parallel; results are consumed in input order.
+                youtube_executor = ThreadPoolExecutor(max_workers=_YOUTUBE_RESOLVE_WORKERS)
+                for index, job_url in youtube_jobs:
+                    youtube_futures[index] = youtube_executor.submit(_resolve_youtube_source, job_url)
+
+            for index, raw in enumerate(self.raw_urls):
                 if self.isInterruptionRequested():
                     logging.debug("URL resolve worker interrupted")
                     break
@@ -618,61 +988,24 @@ class URLResolveWorker(QThread):
                 try:
                     if _is_youtube_url(url):
                         source_kind = "youtube"
-                        direct_video = _youtube_direct_video_url(url)
-                        if direct_video and not _youtube_looks_like_playlist_url(url):
-                            yt_title, yt_duration, yt_single_error = _extract_youtube_single_metadata(direct_video)
-                            if yt_single_error:
-                                resolved = []
-                                source_error = yt_single_error
-                                _set_error(source_error)
-                                logging.warning(
-                                    "YouTube direct video rejected: url=%s reason=%s",
-                                    url,
-                                    yt_single_error,
-                                )
-                            else:
-                                resolved = [direct_video]
-                                if yt_title and not _is_placeholder_title(yt_title):
-                                    title_map[direct_video] = yt_title
-                                if yt_duration is not None and yt_duration >= 0:
-                                    duration_map[direct_video] = float(yt_duration)
-                            logging.debug("Resolving URL as direct YouTube video: %s", url)
+                        future = youtube_futures.get(index)
+                        if future is not None:
+                            resolved, yt_titles, yt_durations, source_error = future.result()
                         else:
-                            logging.debug("Resolving URL as YouTube extract: %s", url)
-                            entries, yt_error = _extract_youtube_entries(url)
-                            _set_error(yt_error)
-                            resolved = []
-                            for e in entries:
-                                item_url = e.get("url")
-                                if not item_url:
-                                    continue
-                                resolved.append(str(item_url))
-                                if e.get("title"):
-                                    title_map[str(item_url)] = str(e["title"])
-                                if e.get("duration") is not None:
-                                    try:
-                                        duration_map[str(item_url)] = float(e["duration"])
-                                    except Exception:
-                                        pass
-                            if not resolved:
-                                source_error = yt_error or "no playable YouTube entries found"
-                                _set_error(source_error)
-                            logging.info(
-                                "YouTube resolve result: url=%s items=%d error=%s",
-                                url,
-                                len(resolved),
-                                yt_error or "",
-                            )
+                            resolved, yt_titles, yt_durations, source_error = _resolve_youtube_source(url)
+                        title_map.update(yt_titles)
+                        duration_map.update(yt_durations)
+                        _set_error(source_error)
                     elif _looks_like_m3u_url(url):
                         source_kind = "m3u"
                         logging.debug("Resolving URL as remote playlist: %s", url)
-                        resolved = _fetch_remote_m3u(url, auth=self.auth)
+                        resolved = _fetch_remote_m3u(url, auth=self.auth, pool=http_pool)
                         if not resolved:
                             raise ValueError("no entries found in remote playlist")
                     elif _looks_like_directory_stream_url(url):
                         source_kind = "webdav"
                         logging.debug("Resolving URL as WebDAV folder: %s", url)
-                        resolved = _fetch_webdav_files_recursive(url, auth=self.auth)
+                        resolved = _fetch_webdav_files_recursive(url, auth=self.auth, pool=http_pool)
                         if not resolved:
                             raise ValueError("no media files found in webdav folder")
                     else:
@@ -739,21 +1072,28 @@ class URLResolveWorker(QThread):
                 if not resolved and source_error:
                     _record_failure(url, source_error)
 
+                # Dedup into a per-source batch, then extend once.
+                new_items = []
+                append_new = new_items.append
                 for item in resolved:
-                    item_value = str(item)
+                    item_value = item if isinstance(item, str) else str(item)
                     if _is_stream_url(item_value):
                         item_value = _sanitize_http_url(item_value)
-                    key = item_value.casefold()
+                    key = item_value.lower()
                     if key not in seen:
                         seen.add(key)
-                        all_items.append(item_value)
-                        if len(all_items) % 20 == 0:
-                            self.progress_count.emit(len(all_items))
+                        append_new(item_value)
+                if new_items:
+                    all_items.extend(new_items)
+                    emit_progress(len(all_items))
         except Exception:
             logging.exception("URL resolver crashed")
             if not last_error:
                 last_error = "URL resolver crashed"
         finally:
+            if youtube_executor is not None:
+                youtube_executor.shutdown(wait=False, cancel_futures=True)
+            http_pool.close()
             logging.info(
                 "URL resolve worker finished: resolved=%d titles=%d durations=%d failures=%d error=%s",
                 len(all_items),
@@ -809,6 +1149,138 @@ class DurationScanner(QThread):
                 continue
 
 
+class CollectPathsWorker(QThread):
+    finished_paths = Signal(list)
+    progress_count = Signal(int)
+
+    def __init__(self, paths, recursive: bool = False, include_audio: bool = True):
+        super().__init__()
+        self.paths = [Path(p) for p in paths]
+        self.recursive = bool(recursive)
+        self.include_audio = bool(include_audio)
+
+    def run(self):
+        files = collect_paths(
+            self.paths,
+            recursive=self.recursive,
+            include_audio=self.include_audio,
+            progress_cb=_throttled_progress_emitter(self.progress_count),
+            progress_step=100,
+        )
+        if self.isInterruptionRequested():
+            return
+        self.finished_paths.emit(files)
+
+
+class DropTriageWorker(QThread):
+    finished_triage = Signal(object, list, list, list, list)  # worker, media, subtitles, folders, m3u
+
+    def __init__(self, paths, include_audio: bool = True, remote_urls=None, replace_existing: bool = False):
+        super().__init__()
+        self.paths = [str(p) for p in paths]
+        self.include_audio = bool(include_audio)
+        self.remote_urls = list(remote_urls or [])
+        self.replace_existing = bool(replace_existing)
+
+    def run(self):
+        media_files = []
+        subtitle_files = []
+        folders = []
+        local_m3u_files = []
+        for token in self.paths:
+            if self.isInterruptionRequested():
+                return
+            try:
+                mode = os.stat(token).st_mode
+            except OSError:
+                continue
+            if stat.S_ISDIR(mode):
+                folders.append(Path(token))
+                continue
+            if not stat.S_ISREG(mode):
+                continue
+            # Dropped paths are already absolute; media gets resolved later by collect_paths.
+            ext = os.path.splitext(token)[1].lower()
+            if ext in _SUBTITLE_EXTS:
+                subtitle_files.append(os.path.abspath(token))
+            elif _looks_like_m3u_path(token):
+                local_m3u_files.append(Path(token))
+            elif is_playable_file(Path(token), include_audio=self.include_audio):
+                media_files.append(token)
+        self.finished_triage.emit(self, media_files, subtitle_files, folders, local_m3u_files)
+
+
+# (playing, playlist size bucket) -> scanner batch size; small batches keep playback smooth.
+_DURATION_BATCH_SIZES = {
+    (True, "big"): 1,
+    (True, "mid"): 2,
+    (True, "small"): 3,
+    (False, "big"): 25,
+    (False, "mid"): 80,
+    (False, "small"): 80,
+}
+
+
+def _write_m3u_file(path: str, playlist, current_index: int, titles: dict, raw_durations: dict):
+    current_index = current_index if 0 <= current_index < len(playlist) else -1
+    current_path = str(playlist[current_index]) if current_index >= 0 else ""
+    lines = [
+        "#EXTM3U\n",
+        f"#EXTCADRE:CURRENT_INDEX={current_index}\n",
+        f"#EXTCADRE:CURRENT_PATH={quote(current_path, safe='')}\n",
+    ]
+    for item_path in playlist:
+        name = titles.get(item_path, "").strip()
+        if _is_youtube_url(item_path) and _is_placeholder_title(name):
+            name = ""
+        if not name:
+            if _is_stream_url(item_path):
+                name = _fallback_stream_title(item_path)
+            else:
+                name = os.path.basename(item_path)
+        raw_dur = raw_durations.get(item_path, -1)
+        dur_int = int(raw_dur) if raw_dur > 0 else -1
+        lines.append(f"#EXTINF:{dur_int},{name}\n{item_path}\n")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("".join(lines))
+
+
+class M3UWriteWorker(QThread):
+    finished_write = Signal(object, str)  # worker, error
+
+    def __init__(self, path: str, playlist, current_index: int, titles: dict, raw_durations: dict):
+        super().__init__()
+        self.path = str(path)
+        self.playlist = playlist
+        self.current_index = current_index
+        self.titles = titles
+        self.raw_durations = raw_durations
+
+    def run(self):
+        try:
+            _write_m3u_file(self.path, self.playlist, self.current_index, self.titles, self.raw_durations)
+        except Exception as e:
+            self.finished_write.emit(self, str(e) or type(e).__name__)
+            return
+        self.finished_write.emit(self, "")
+
+
+class M3UParseWorker(QThread):
+    finished_parse = Signal(object, list, dict, dict, str)  # worker, entries, titles, durations, error
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = str(path)
+
+    def run(self):
+        try:
+            entries, title_map, duration_map = parse_local_m3u_with_meta(self.path)
+        except Exception as e:
+            self.finished_parse.emit(self, [], {}, {}, str(e) or type(e).__name__)
+            return
+        self.finished_parse.emit(self, entries, title_map, duration_map, "")
+
+
 class PlaylistPrepareWorker(QThread):
     finished_paths = Signal(list)
     progress_count = Signal(int)
@@ -843,38 +1315,40 @@ class PlaylistPrepareWorker(QThread):
         return []
 
     def run(self):
+        emit_progress = _throttled_progress_emitter(self.progress_count)
         if self.use_collect:
-            candidates = collect_paths(
+            collected, exts = collect_paths_with_exts(
                 [Path(p) for p in self.raw_paths],
                 recursive=self.recursive,
                 include_audio=self.include_audio,
-                progress_cb=self.progress_count.emit,
+                progress_cb=emit_progress,
                 progress_step=100,
             )
+            # The scan already checked these are playable files; only archives need expanding.
+            candidates = []
+            for candidate, ext in zip(collected, exts):
+                if ext in ARCHIVE_EXTENSION_SET:
+                    candidates.extend(self._expand_candidate(candidate))
+                else:
+                    candidates.append(candidate)
         else:
             candidates = []
             for raw in self.raw_paths:
                 candidates.extend(self._expand_candidate(raw))
 
-        if self.use_collect:
-            expanded = []
-            for candidate in candidates:
-                expanded.extend(self._expand_candidate(candidate))
-            candidates = expanded
-
         unique_paths = []
         seen = set(self.existing_keys)
-        last_emitted = 0
+        seen_add = seen.add
+        append_unique = unique_paths.append
+        cwd = os.getcwd()
         for candidate in candidates:
             if self.isInterruptionRequested():
                 break
-            p_str, key = normalize_playlist_entry(candidate)
+            p_str, key = normalize_playlist_entry(candidate, cwd)
             if key not in seen:
-                unique_paths.append(p_str)
-                seen.add(key)
-            if len(unique_paths) - last_emitted >= 200:
-                last_emitted = len(unique_paths)
-                self.progress_count.emit(last_emitted)
+                append_unique(p_str)
+                seen_add(key)
+                emit_progress(len(unique_paths))
         self.progress_count.emit(len(unique_paths))
         self.finished_paths.emit(unique_paths)
 
@@ -981,23 +1455,38 @@ class PlaylistViewMixin:
 
         effective_target = drop_target if drop_target in {"video", "playlist"} else "video"
         replace_existing = effective_target == "video"
-        subtitle_exts = {".srt", ".ass", ".ssa", ".sub", ".vtt"}
-        media_files = []
-        subtitle_files = []
-        folders = []
-        local_m3u_files = []
-        for p in paths:
-            if p.is_file():
-                ext = p.suffix.lower()
-                if ext in subtitle_exts:
-                    subtitle_files.append(str(p.resolve()))
-                elif _looks_like_m3u_path(str(p)):
-                    local_m3u_files.append(p)
-                elif is_playable_file(p, include_audio=self._include_audio_in_imports()):
-                    media_files.append(str(p.resolve()))
-            elif p.is_dir():
-                folders.append(p)
+        if not paths:
+            self._import_dropped_sources([], [], [], [], remote_urls, replace_existing)
+            return
+
+        # stat/resolve per dropped path runs off the UI thread.
+        worker = DropTriageWorker(
+            paths,
+            include_audio=self._include_audio_in_imports(),
+            remote_urls=remote_urls,
+            replace_existing=replace_existing,
+        )
+        worker.finished_triage.connect(self._on_drop_triage_finished)
+        worker.finished.connect(lambda: worker.deleteLater())
+        self._drop_triage_workers.add(worker)
+        worker.start()
+
+    def _on_drop_triage_finished(self, worker, media_files, subtitle_files, folders, local_m3u_files):
+        self._drop_triage_workers.discard(worker)
+        if self._is_shutting_down:
+            return
+        self._import_dropped_sources(
+            media_files,
+            subtitle_files,
+            folders,
+            local_m3u_files,
+            worker.remote_urls,
+            worker.replace_existing,
+        )
 
+    def _import_dropped_sources(
+        self, media_files, subtitle_files, folders, local_m3u_files, remote_urls, replace_existing
+    ):
         remote_m3u_urls = [u for u in remote_urls if _looks_like_m3u_url(u)]
         direct_stream_urls = [u for u in remote_urls if _is_stream_url(u) and not _looks_like_m3u_url(u)]
 
@@ -1079,7 +1568,21 @@ class PlaylistViewMixin:
             self.quick_open_file(paths[0])
             return
 
-        loaded = self.collect_paths(paths, recursive=True)
+        # Folder walks can take a while; collect on a worker so the window stays responsive.
+        worker = CollectPathsWorker(paths, recursive=True, include_audio=self._include_audio_in_imports())
+        worker.progress_count.connect(self._on_prepare_worker_progress, Qt.QueuedConnection)
+        worker.finished_paths.connect(self._on_startup_paths_collected)
+        worker.finished.connect(lambda: worker.deleteLater())
+        self._startup_collect_worker = worker
+        self._start_import_progress(0)
+        worker.start()
+
+    def _on_startup_paths_collected(self, loaded):
+        self._startup_collect_worker = None
+        if self._is_shutting_down:
+            return
+        if self._active_prepare_worker is None and not self._prepare_queue and not self._pending_model_appends:
+            self._stop_import_progress()
         if not loaded:
             return
         old_set = set(str(p) for p in self.playlist)
@@ -1098,7 +1601,8 @@ class PlaylistViewMixin:
         self.play_current()
 
     def quick_open_file(self, file_path: Path):
-        selected = file_path.resolve()
+        sel_str = os.path.realpath(str(file_path))
+        selected = Path(sel_str)
         if is_archive_file(selected):
             archive_items = list_archive_member_sources(selected, include_audio=self._include_audio_in_imports())
             if archive_items:
@@ -1112,11 +1616,10 @@ class PlaylistViewMixin:
                 self._save_session_playlist_snapshot()
                 self.play_current()
                 return
-            selected_str = str(selected)
             old_set = set(str(p) for p in self.playlist)
-            new_set = {selected_str}
+            new_set = {sel_str}
             self._prune_playlist_metadata(old_set - new_set)
-            self.playlist = [selected_str]
+            self.playlist = [sel_str]
             self.current_index = 0
             self.rebuild_shuffle_order(keep_current=True)
             self.refresh_playlist_view()
@@ -1124,7 +1627,6 @@ class PlaylistViewMixin:
             self.play_current()
             return
 
-        sel_str = os.path.normpath(str(selected))
         sel_lower = sel_str.lower()
 
         siblings = list_folder_media(
@@ -1158,9 +1660,8 @@ class PlaylistViewMixin:
         if not paths:
             return []
 
-        existing_keys = {normalize_playlist_entry(existing)[1] for existing in self.playlist}
         unique_paths = []
-        seen = set(existing_keys)
+        seen = set(self._playlist_key_set())
         for p in paths:
             p_str, key = normalize_playlist_entry(p)
             if key not in seen:
@@ -1209,7 +1710,7 @@ class PlaylistViewMixin:
 
         self._active_prepare_request = self._prepare_queue.popleft()
         req = self._active_prepare_request
-        existing_keys = {normalize_playlist_entry(existing)[1] for existing in self.playlist}
+        existing_keys = self._playlist_key_set()
         self._apply_resolved_metadata(
             title_map=req.get("title_map", {}),
             duration_map=req.get("duration_map", {}),
@@ -1222,7 +1723,7 @@ class PlaylistViewMixin:
             include_audio=self._include_audio_in_imports(),
         )
         self._start_import_progress(0)
-        worker.progress_count.connect(self._on_prepare_worker_progress)
+        worker.progress_count.connect(self._on_prepare_worker_progress, Qt.QueuedConnection)
         worker.finished_paths.connect(self._on_prepare_worker_finished)
         worker.finished.connect(lambda: worker.deleteLater())
         self._active_prepare_worker = worker
@@ -1248,6 +1749,8 @@ class PlaylistViewMixin:
         if callable(callback):
             callback(added)
 
+        if not self._prepare_queue and self._session_snapshot_deferred:
+            self._save_session_playlist_snapshot()
         self._start_next_prepare_worker()
         if self._active_prepare_worker is None and not self._prepare_queue and not self._pending_model_appends:
             self._stop_import_progress()
@@ -1255,6 +1758,7 @@ class PlaylistViewMixin:
     def _start_import_progress(self, initial_count=0):
         self._import_progress_active = True
         self._import_progress_count = max(0, int(initial_count))
+        self._last_import_status_count = -1
         self._refresh_import_status()
         if not self._import_status_timer.isActive():
             self._import_status_timer.start()
@@ -1264,7 +1768,19 @@ class PlaylistViewMixin:
             return
         if not self._import_progress_active:
             return
-        self.show_status_overlay(tr("Adding files... {}").format(self._import_progress_count))
+        count = self._import_progress_count
+        if (
+            count == self._last_import_status_count
+            and self.speed_indicator_timer.isActive()
+            and self.speed_overlay.label.text() == self._last_import_status_text
+        ):
+            # Same text is still on screen; only keep it from timing out.
+            self.speed_indicator_timer.start()
+            return
+        text = tr("Adding files... {}").format(count)
+        self._last_import_status_count = count
+        self._last_import_status_text = text
+        self.show_status_overlay(text)
 
     def _stop_import_progress(self):
         self._import_progress_active = False
@@ -1304,11 +1820,18 @@ class PlaylistViewMixin:
             return []
 
         start_count = len(self.playlist)
+        keys_valid = self._playlist_keys_valid()
         self.playlist.extend(unique_paths)
+        if keys_valid:
+            self._playlist_keys.update(normalize_playlist_entry(p)[1] for p in unique_paths)
+            self._playlist_keys_len = len(self.playlist)
+        path_index = self._path_to_index
+        for row, path in enumerate(unique_paths, start=start_count):
+            path_index.setdefault(path, row)
         if self.current_index < 0 and self.playlist:
             self.current_index = 0
 
-        self.rebuild_shuffle_order(keep_current=True)
+        self.rebuild_shuffle_order(keep_current=True, new_count=len(unique_paths))
 
         if start_count > 0:
             self._append_to_view(unique_paths)
@@ -1331,7 +1854,11 @@ class PlaylistViewMixin:
             self.current_index,
             play_new,
         )
-        self._save_session_playlist_snapshot()
+        if self._prepare_queue:
+            # More imports are queued; write the session playlist once after the last one.
+            self._session_snapshot_deferred = True
+        else:
+            self._save_session_playlist_snapshot()
         return unique_paths
 
     def import_stream_sources_async(
@@ -1380,7 +1907,7 @@ class PlaylistViewMixin:
         self._url_progress_count = 0
         self._start_url_resolve_status()
         worker = self._create_url_resolve_worker(req["urls"], auth=req.get("auth"))
-        worker.progress_count.connect(self._on_url_worker_progress)
+        worker.progress_count.connect(self._on_url_worker_progress, Qt.QueuedConnection)
         worker.finished_urls.connect(self._on_url_worker_finished)
         worker.finished.connect(lambda: worker.deleteLater())
         self._active_url_worker = worker
@@ -1423,9 +1950,8 @@ class PlaylistViewMixin:
         token = f"{username}:{password}".encode("utf-8")
         auth_value = "Basic " + base64.b64encode(token).decode("ascii")
         for item in urls:
-            parsed = urlparse(str(item))
-            if parsed.scheme in {"http", "https"} and parsed.netloc:
-                host = parsed.netloc.split("@")[-1].lower()
+            host = _http_auth_host(str(item))
+            if host:
                 self._stream_auth_by_host[host] = auth_value
                 while len(self._stream_auth_by_host) > self._stream_auth_cache_limit:
                     self._stream_auth_by_host.pop(next(iter(self._stream_auth_by_host)), None)
@@ -1440,14 +1966,14 @@ class PlaylistViewMixin:
         preset_duration_map = dict(req.get("duration_map", {}) if isinstance(req, dict) else {})
         title_map = dict(title_map or {})
         duration_map = dict(duration_map or {})
-        resolved_set = {str(u).casefold() for u in (resolved_urls or [])}
+        resolved_set = {str(u).lower() for u in (resolved_urls or [])}
         for key, value in preset_title_map.items():
             s_key = str(key)
-            if s_key.casefold() in resolved_set and s_key not in title_map and str(value).strip():
+            if s_key.lower() in resolved_set and s_key not in title_map and str(value).strip():
                 title_map[s_key] = str(value).strip()
         for key, value in preset_duration_map.items():
             s_key = str(key)
-            if s_key.casefold() not in resolved_set or s_key in duration_map:
+            if s_key.lower() not in resolved_set or s_key in duration_map:
                 continue
             try:
                 sec = float(value)
@@ -1518,31 +2044,7 @@ class PlaylistViewMixin:
         self._start_next_url_worker()
 
     def add_files_dialog(self):
-        include_audio = self._include_audio_in_imports()
-        if include_audio:
-            filter_str = (
-                tr("Media Files ({})").format(
-                    " ".join(f"*{ext}" for ext in VIDEO_EXTENSIONS + AUDIO_EXTENSIONS + ARCHIVE_EXTENSIONS)
-                )
-                + ";;"
-                + tr("Video Files ({})").format(" ".join(f"*{ext}" for ext in VIDEO_EXTENSIONS))
-                + ";;"
-                + tr("Audio Files ({})").format(" ".join(f"*{ext}" for ext in AUDIO_EXTENSIONS))
-                + ";;"
-                + tr("Archives ({})").format(" ".join(f"*{ext}" for ext in ARCHIVE_EXTENSIONS))
-                + ";;"
-                + tr("All files (*.*)")
-            )
-        else:
-            filter_str = (
-                tr("Video Files ({})").format(
-                    " ".join(f"*{ext}" for ext in VIDEO_EXTENSIONS + ARCHIVE_EXTENSIONS)
-                )
-                + ";;"
-                + tr("Archives ({})").format(" ".join(f"*{ext}" for ext in ARCHIVE_EXTENSIONS))
-                + ";;"
-                + tr("All files (*.*)")
-            )
+        filter_str = _media_filter_string(self._include_audio_in_imports())
         dialog = QFileDialog(self, tr("Select files to open"), "")
         dialog.setFileMode(QFileDialog.ExistingFiles)
         dialog.setNameFilter(filter_str)
@@ -1578,37 +2080,32 @@ class PlaylistViewMixin:
         is_playing = (not self._cached_paused and self.current_index >= 0)
         if is_playing and not allow_while_playing:
             return 0
-        if is_playing:
-            if len(self.playlist) > 1000:
-                return 1
-            if len(self.playlist) > 800:
-                return 2
-            return 3
-        if len(self.playlist) > 1000:
-            return 25
-        return 80
+        count = len(self.playlist)
+        bucket = "big" if count > 1000 else "mid" if count > 800 else "small"
+        return _DURATION_BATCH_SIZES[(is_playing, bucket)]
 
     def scan_durations(self, paths=None, allow_while_playing: bool = False, force: bool = False):
         if not force and not self._full_duration_scan_active:
             return
         if paths:
             local_paths = [p for p in paths if not _is_stream_url(str(p))]
-            existing = set(str(p) for p in self._pending_duration_paths)
+            pending_set = self._pending_duration_set
             cap = 5000
             for p in local_paths:
                 if len(self._pending_duration_paths) >= cap:
                     break
                 p_str = str(p)
-                if p_str not in existing:
+                if p_str not in pending_set:
                     self._pending_duration_paths.append(p_str)
-                    existing.add(p_str)
+                    pending_set.add(p_str)
         if self.scanners:
             return
         batch_size = self._duration_scan_batch_size(allow_while_playing=allow_while_playing)
         if batch_size <= 0:
             return
-        batch = list(self._pending_duration_paths[:batch_size])
-        self._pending_duration_paths = self._pending_duration_paths[len(batch):]
+        pending = self._pending_duration_paths
+        batch = [pending.popleft() for _ in range(min(batch_size, len(pending)))]
+        self._pending_duration_set.difference_update(batch)
         if not batch:
             return
         scanner = DurationScanner(batch)
@@ -1642,13 +2139,23 @@ class PlaylistViewMixin:
             return
         self.playlist_durations[path] = dur_str
         self.playlist_raw_durations[path] = seconds
-        if hasattr(self, "playlist_model"):
-            self.playlist_model.update_duration(path, dur_str)
+        self._pending_duration_updates[path] = dur_str
         if self._full_duration_scan_active:
             self._full_duration_scan_done = min(
                 self._full_duration_scan_total,
                 self._full_duration_scan_done + 1,
             )
+        if not self._duration_flush_timer.isActive():
+            self._duration_flush_timer.start()
+
+    def _flush_duration_updates(self):
+        self._duration_flush_timer.stop()
+        if self._is_shutting_down:
+            return
+        if self._pending_duration_updates and self.playlist_model is not None:
+            self.playlist_model.update_durations_bulk(self._pending_duration_updates)
+        self._pending_duration_updates = {}
+        if self._full_duration_scan_active:
             self.show_status_overlay(
                 tr("Scanning durations... {}/{}").format(
                     self._full_duration_scan_done,
@@ -1658,8 +2165,10 @@ class PlaylistViewMixin:
 
     def _finish_full_duration_scan(self, cancelled: bool):
         self._full_duration_scan_active = False
+        self._flush_duration_updates()
         self._full_duration_scan_cancel_requested = False
         self._pending_duration_paths.clear()
+        self._pending_duration_set.clear()
         if cancelled:
             self.show_status_overlay(
                 tr("Duration scan cancelled ({}/{})").format(
@@ -1682,6 +2191,7 @@ class PlaylistViewMixin:
         if self._full_duration_scan_active:
             self._full_duration_scan_cancel_requested = True
             self._pending_duration_paths.clear()
+            self._pending_duration_set.clear()
             for scanner in list(self.scanners):
                 try:
                     scanner.requestInterruption()
@@ -1723,7 +2233,8 @@ class PlaylistViewMixin:
         self._full_duration_scan_cancel_requested = False
         self._full_duration_scan_total = len(targets)
         self._full_duration_scan_done = 0
-        self._pending_duration_paths = list(targets)
+        self._pending_duration_paths = deque(targets)
+        self._pending_duration_set = set(self._pending_duration_paths)
         self._set_mpv_property_safe("pause", True, allow_during_busy=True)
         self._cached_paused = True
         self._user_paused = True
@@ -1732,7 +2243,7 @@ class PlaylistViewMixin:
         self.scan_durations(None, allow_while_playing=True, force=True)
 
     def refresh_playlist_view(self):
-        if not hasattr(self, "playlist_widget"):
+        if self.playlist_widget is None:
             return
 
         state = self._capture_playlist_view_state()
@@ -1747,7 +2258,7 @@ class PlaylistViewMixin:
         self._restore_playlist_view_state(state)
 
     def _append_to_view(self, paths, apply_filter: bool = True):
-        if not hasattr(self, "playlist_widget") or not paths:
+        if self.playlist_widget is None or not paths:
             return
         self._pending_model_appends.extend(paths)
         if apply_filter:
@@ -1768,12 +2279,12 @@ class PlaylistViewMixin:
             return
 
         chunk_size = 250
-        chunk = self._pending_model_appends[:chunk_size]
-        del self._pending_model_appends[:chunk_size]
+        pending = self._pending_model_appends
+        chunk = [pending.popleft() for _ in range(min(chunk_size, len(pending)))]
         self.playlist_model.append_paths(chunk, self.playlist_durations, self.playlist_titles)
 
     def toggle_playlist_search(self):
-        if not hasattr(self, "playlist_search_input"):
+        if self.playlist_search_input is None:
             return
 
         if self.playlist_search_input.isVisible():
@@ -1793,24 +2304,41 @@ class PlaylistViewMixin:
         self.playlist_search_input.selectAll()
 
     def schedule_playlist_filter(self):
-        # Filter from the first character; only debounce to keep typing smooth.
+        # Leading edge filters the first keystroke at once; a burst then coalesces into
+        # one trailing pass, with the max-delay timer forcing feedback during long typing.
+        if not self._search_debounce_timer.isActive():
+            self.apply_playlist_filter()
+            self._search_debounce_timer.start()
+            return
+        self._search_filter_pending = True
         self._search_debounce_timer.start()
+        if not self._search_max_delay_timer.isActive():
+            self._search_max_delay_timer.start()
+
+    def _flush_playlist_filter(self):
+        if self._search_filter_pending:
+            self.apply_playlist_filter()
 
     def apply_playlist_filter(self, scroll_mode: str = "preserve"):
-        if not hasattr(self, "playlist_widget"):
+        self._search_filter_pending = False
+        self._search_max_delay_timer.stop()
+        if self.playlist_widget is None:
             return
 
         term = ""
-        if hasattr(self, "playlist_search_input"):
+        if self.playlist_search_input is not None:
             term = self.playlist_search_input.text().strip().casefold()
 
         self.playlist_filter_model.set_query(term)
 
         can_reorder = not bool(term)
-        self.playlist_widget.setDragEnabled(can_reorder)
-        self.playlist_widget.setDragDropMode(
-            QAbstractItemView.InternalMove if can_reorder else QAbstractItemView.NoDragDrop
-        )
+        if can_reorder != self._filter_can_reorder:
+            self._filter_can_reorder = can_reorder
+            self.playlist_widget.setDragEnabled(can_reorder)
+            self.playlist_widget.setDragDropMode(
+                QAbstractItemView.InternalMove if can_reorder else QAbstractItemView.NoDragDrop
+            )
+        # Callers rely on this for scrolling after model resets, so it runs even for an unchanged term.
         self.highlight_current_item(scroll_mode=scroll_mode)
 
     def _proxy_index_to_playlist_row(self, proxy_index):
@@ -1825,7 +2353,7 @@ class PlaylistViewMixin:
         return row
 
     def get_selected_playlist_indices(self):
-        if not hasattr(self, "playlist_widget"):
+        if self.playlist_widget is None:
             return []
         selection_model = self.playlist_widget.selectionModel()
         if not selection_model:
@@ -1907,30 +2435,57 @@ class PlaylistViewMixin:
         if not indices:
             return
 
-        current_removed = self.current_index in indices
+        # Built once: membership tests below are O(1) instead of scans over the index list.
+        removal_set = frozenset(indices)
+        current_removed = self.current_index in removal_set
         current_path = (
             self.playlist[self.current_index] if 0 <= self.current_index < len(self.playlist) else None
         )
 
+        # One pass over the playlist instead of a pop (and tail shift) per removed row.
+        kept = []
         removed_paths = []
-        # Remove in reverse order
-        for idx in sorted(indices, reverse=True):
-            if 0 <= idx < len(self.playlist):
-                removed_path = self.playlist.pop(idx)
-                removed_paths.append(removed_path)
-        self._prune_playlist_metadata(removed_paths)
+        removed_before_current = 0
+        for idx, path in enumerate(self.playlist):
+            if idx in removal_set:
+                removed_paths.append(path)
+                if idx < self.current_index:
+                    removed_before_current += 1
+            else:
+                kept.append(path)
+        self.playlist = kept
+        # Paths that are still listed elsewhere (duplicates) keep their metadata.
+        surviving = set(kept)
+        gone = {path for path in removed_paths if path not in surviving}
+        if len(gone) > 256:
+            # Bulk removals: one rebuild per dict instead of a pop per path.
+            self.playlist_titles = {p: t for p, t in self.playlist_titles.items() if p not in gone}
+            self.playlist_durations = {p: d for p, d in self.playlist_durations.items() if p not in gone}
+            self.playlist_raw_durations = {
+                p: d for p, d in self.playlist_raw_durations.items() if p not in gone
+            }
+        else:
+            self._prune_playlist_metadata(gone)
+        if not self.playlist:
+            new_index = -1
+        elif current_path is not None and not current_removed:
+            new_index = self.current_index - removed_before_current
+        else:
+            # The current row itself went away; a duplicate of it may still be listed.
+            new_index = self._playlist_index_of(current_path)
 
         if not self.playlist:
             self.current_index = -1
             self.player.stop()
             self.setWindowTitle("Cadre Player")
-            if hasattr(self, "title_bar"):
+            if self.title_bar is not None:
                 self.title_bar.info_label.setText("")
             self.seek_slider.set_current_time(0.0)
             self.seek_slider.set_chapters([])
+            self._timeline_key = None
             self.sync_size()
-        elif current_path and current_path in self.playlist:
-            self.current_index = self.playlist.index(current_path)
+        elif new_index >= 0:
+            self.current_index = new_index
         else:
             if self.current_index >= len(self.playlist):
                 self.current_index = len(self.playlist) - 1
@@ -1955,7 +2510,7 @@ class PlaylistViewMixin:
 
         paths = [self.playlist[i] for i in indices]
         if len(paths) == 1:
-            msg = tr("Recycle:\n{}?").format(Path(paths[0]).name)
+            msg = tr("Recycle:\n{}?").format(os.path.basename(paths[0]))
         else:
             msg = tr("Recycle {} selected files?").format(len(paths))
 
@@ -1990,6 +2545,34 @@ class PlaylistViewMixin:
     def delete_selected_file_to_trash(self):
         self.delete_to_trash()
 
+    def _playlist_index_of(self, path) -> int:
+        # O(1) lookup; a slot that no longer matches (reorder/removal) triggers one lazy rebuild.
+        if not path:
+            return -1
+        playlist = self.playlist
+        idx = self._path_to_index.get(path, -1)
+        if 0 <= idx < len(playlist) and playlist[idx] == path:
+            return idx
+        index = {}
+        for row, item in enumerate(playlist):
+            index.setdefault(item, row)
+        self._path_to_index = index
+        return index.get(path, -1)
+
+    def _playlist_keys_valid(self) -> bool:
+        return (
+            self._playlist_keys_source is self.playlist
+            and self._playlist_keys_len == len(self.playlist)
+        )
+
+    def _playlist_key_set(self) -> set:
+        # Normalized dedup keys; rebuilt only when the playlist was replaced or shrank/grew elsewhere.
+        if not self._playlist_keys_valid():
+            self._playlist_keys = {normalize_playlist_entry(p)[1] for p in self.playlist}
+            self._playlist_keys_source = self.playlist
+            self._playlist_keys_len = len(self.playlist)
+        return self._playlist_keys
+
     def _prune_playlist_metadata(self, paths):
         for item in paths or []:
             key = str(item)
@@ -2013,13 +2596,8 @@ class PlaylistViewMixin:
                 continue
             if value:
                 self.playlist_titles[path] = value
-        for path, seconds in (duration_map or {}).items():
-            try:
-                sec = float(seconds)
-                self.playlist_raw_durations[path] = sec
-                self.playlist_durations[path] = format_duration(sec)
-            except (TypeError, ValueError):
-                continue
+        if duration_map:
+            _apply_duration_map(duration_map, self.playlist_raw_durations, self.playlist_durations)
 
     def _playlist_path_from_proxy_index(self, proxy_index) -> str:
         row = self._proxy_index_to_playlist_row(proxy_index)
@@ -2036,7 +2614,7 @@ class PlaylistViewMixin:
         return self.playlist_filter_model.mapFromSource(self.playlist_model.index(source_row, 0))
 
     def _capture_playlist_view_state(self) -> dict:
-        if not hasattr(self, "playlist_widget"):
+        if self.playlist_widget is None:
             return {}
 
         widget = self.playlist_widget
@@ -2064,7 +2642,7 @@ class PlaylistViewMixin:
         }
 
     def _restore_playlist_view_state(self, state: dict) -> None:
-        if not hasattr(self, "playlist_widget") or not state:
+        if self.playlist_widget is None or not state:
             return
 
         widget = self.playlist_widget
@@ -2095,13 +2673,18 @@ class PlaylistViewMixin:
         bar.setValue(int(state.get("scroll_value", 0) or 0))
 
     def highlight_current_item(self, scroll_mode: str = "preserve"):
-        if not hasattr(self, "playlist_widget"):
+        if self.playlist_widget is None:
             return
         try:
+            previous = self._last_highlighted_index
+            self._last_highlighted_index = self.current_index
             self.playlist_widget.setProperty("current_playlist_index", self.current_index)
-            self.playlist_widget.viewport().update()
             if not self.playlist_widget.isVisible():
                 return
+            # Only the rows that gain or lose the highlight need repainting.
+            if previous != self.current_index:
+                self._repaint_playlist_row(previous)
+            self._repaint_playlist_row(self.current_index)
             if self.current_index < 0 or self.current_index >= len(self.playlist):
                 return
             source_idx = self.playlist_model.index(self.current_index, 0)
@@ -2117,6 +2700,13 @@ class PlaylistViewMixin:
         except Exception:
             logging.exception("highlight_current_item failed")
 
+    def _repaint_playlist_row(self, row: int):
+        if not (0 <= row < self.playlist_model.rowCount()):
+            return
+        proxy_idx = self.playlist_filter_model.mapFromSource(self.playlist_model.index(row, 0))
+        if proxy_idx.isValid():
+            self.playlist_widget.update(proxy_idx)
+
     def sync_playlist_from_widget(self):
         if self._playlist_refresh_lock:
             return
@@ -2129,10 +2719,7 @@ class PlaylistViewMixin:
             return
 
         self.playlist = reordered
-        if current_path and current_path in self.playlist:
-            self.current_index = self.playlist.index(current_path)
-        else:
-            self.current_index = -1
+        self.current_index = self._playlist_index_of(current_path)
         self.rebuild_shuffle_order(keep_current=True)
         self.highlight_current_item(scroll_mode="preserve")
         self._save_session_playlist_snapshot()
@@ -2193,27 +2780,30 @@ class PlaylistViewMixin:
         )
 
         if criteria == "name":
+            # Decorate once so each key is built exactly once; itemgetter keeps the sort stable.
             if self.sort_include_folders:
-                self.playlist.sort(key=lambda x: x.lower(), reverse=reverse)
+                decorated = [(x.lower(), x) for x in self.playlist]
             else:
-                self.playlist.sort(key=lambda x: Path(x).name.lower(), reverse=reverse)
+                basename = os.path.basename
+                decorated = [(basename(x).lower(), x) for x in self.playlist]
+            decorated.sort(key=itemgetter(0), reverse=reverse)
+            self.playlist = [x for _, x in decorated]
         elif criteria == "duration":
             known = []
             unknown = []
+            raw_durations = self.playlist_raw_durations
             for item in self.playlist:
-                dur = self.playlist_raw_durations.get(item)
+                dur = raw_durations.get(item)
                 if isinstance(dur, (int, float)) and dur > 0:
-                    known.append(item)
+                    known.append((float(dur), item))
                 else:
                     unknown.append(item)
-            known.sort(
-                key=lambda x: float(self.playlist_raw_durations.get(x, 0.0)),
-                reverse=reverse,
-            )
-            self.playlist = known + unknown
+            known.sort(key=itemgetter(0), reverse=reverse)
+            self.playlist = [x for _, x in known] + unknown
 
-        if current_path and current_path in self.playlist:
-            self.current_index = self.playlist.index(current_path)
+        new_index = self._playlist_index_of(current_path)
+        if new_index >= 0:
+            self.current_index = new_index
 
         self.rebuild_shuffle_order(keep_current=True)
         key_name = tr("Path") if (criteria == "name" and self.sort_include_folders) else tr(criteria.capitalize())
@@ -2225,27 +2815,22 @@ class PlaylistViewMixin:
         return str(get_user_data_path("session_playlist.m3u"))
 
     def _write_m3u_playlist(self, path: str):
-        with open(path, "w", encoding="utf-8") as f:
-            f.write("#EXTM3U\n")
-            current_index = int(self.current_index) if 0 <= int(self.current_index) < len(self.playlist) else -1
-            current_path = ""
-            if current_index >= 0:
-                current_path = str(self.playlist[current_index])
-            f.write(f"#EXTCADRE:CURRENT_INDEX={current_index}\n")
-            f.write(f"#EXTCADRE:CURRENT_PATH={quote(current_path, safe='')}\n")
-            for item_path in self.playlist:
-                name = self.playlist_titles.get(item_path, "").strip()
-                if _is_youtube_url(item_path) and _is_placeholder_title(name):
-                    name = ""
-                if not name:
-                    if _is_stream_url(item_path):
-                        name = _fallback_stream_title(item_path)
-                    else:
-                        name = Path(item_path).name
-                raw_dur = self.playlist_raw_durations.get(item_path, -1)
-                dur_int = int(raw_dur) if raw_dur > 0 else -1
-                f.write(f"#EXTINF:{dur_int},{name}\n")
-                f.write(f"{item_path}\n")
+        _write_m3u_file(
+            path,
+            self.playlist,
+            int(self.current_index),
+            self.playlist_titles,
+            self.playlist_raw_durations,
+        )
+
+    def _m3u_snapshot(self):
+        # Copies taken on the UI thread so a writer thread never sees the playlist mutate.
+        return (
+            list(self.playlist),
+            int(self.current_index),
+            dict(self.playlist_titles),
+            dict(self.playlist_raw_durations),
+        )
 
     def _read_session_snapshot_meta(self, path: str) -> tuple[int, str]:
         current_index = -1
@@ -2272,6 +2857,7 @@ class PlaylistViewMixin:
         return current_index, current_path
 
     def _save_session_playlist_snapshot(self):
+        self._session_snapshot_deferred = False
         path = self._session_playlist_path()
         try:
             if not self.playlist:
@@ -2296,8 +2882,9 @@ class PlaylistViewMixin:
                 self._apply_resolved_metadata(title_map=title_map, duration_map=duration_map)
                 # Avoid initial auto-play race: restore target index first, then play once.
                 self.append_to_playlist(entries, play_new=False, autoplay_if_empty=False)
-                if target_path and target_path in self.playlist:
-                    self.current_index = self.playlist.index(target_path)
+                restored_index = self._playlist_index_of(target_path)
+                if restored_index >= 0:
+                    self.current_index = restored_index
                 elif 0 <= target_index < len(self.playlist):
                     self.current_index = int(target_index)
                 elif self.playlist:
@@ -2330,15 +2917,24 @@ class PlaylistViewMixin:
         if not path.endswith(".m3u"):
             path += ".m3u"
 
-        try:
-            self._write_m3u_playlist(path)
-            self.show_status_overlay(tr("Playlist Saved"))
-        except Exception as e:
+        worker = M3UWriteWorker(path, *self._m3u_snapshot())
+        worker.finished_write.connect(self._on_m3u_write_finished)
+        worker.finished.connect(lambda: worker.deleteLater())
+        self._m3u_io_workers.add(worker)
+        worker.start()
+
+    def _on_m3u_write_finished(self, worker, error):
+        self._m3u_io_workers.discard(worker)
+        if self._is_shutting_down:
+            return
+        if error:
             self._show_message(
                 QMessageBox.Critical,
                 tr("Error"),
-                tr("Could not save playlist: {}").format(e),
+                tr("Could not save playlist: {}").format(error),
             )
+            return
+        self.show_status_overlay(tr("Playlist Saved"))
 
     def load_playlist_m3u(self):
         dialog = QFileDialog(self, tr("Open Playlist"), "")
@@ -2349,27 +2945,37 @@ class PlaylistViewMixin:
         if not path:
             return
 
-        try:
-            entries, title_map, duration_map = parse_local_m3u_with_meta(path)
-            if entries:
-                self._import_playlist_entries(
-                    entries,
-                    replace_existing=True,
-                    title_map=title_map,
-                    duration_map=duration_map,
-                )
-                self.show_status_overlay(tr("Loaded {} items").format(len(entries)))
-            else:
-                self.show_status_overlay(tr("No valid files in playlist"))
-        except Exception as e:
+        # Reading the file and the per-entry existence checks run off the UI thread.
+        worker = M3UParseWorker(path)
+        worker.finished_parse.connect(self._on_m3u_parse_finished)
+        worker.finished.connect(lambda: worker.deleteLater())
+        self._m3u_io_workers.add(worker)
+        worker.start()
+
+    def _on_m3u_parse_finished(self, worker, entries, title_map, duration_map, error):
+        self._m3u_io_workers.discard(worker)
+        if self._is_shutting_down:
+            return
+        if error:
             self._show_message(
                 QMessageBox.Critical,
                 tr("Error"),
-                tr("Could not load playlist: {}").format(e),
+                tr("Could not load playlist: {}").format(error),
             )
+            return
+        if entries:
+            self._import_playlist_entries(
+                entries,
+                replace_existing=True,
+                title_map=title_map,
+                duration_map=duration_map,
+            )
+            self.show_status_overlay(tr("Loaded {} items").format(len(entries)))
+        else:
+            self.show_status_overlay(tr("No valid files in playlist"))
 
     def toggle_playlist_panel(self):
-        if hasattr(self, "playlist_overlay") and self.playlist_overlay.isVisible():
+        if self.playlist_overlay is not None and self.playlist_overlay.isVisible():
             self.playlist_overlay.hide()
             return
         self._sync_playlist_overlay_geometry()
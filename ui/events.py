@@ -3,6 +3,7 @@ import logging
 import os
 import re
 import time
+from bisect import bisect_left
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -11,7 +12,6 @@ from PySide6.QtGui import QColor, QCursor, QDesktopServices, QIcon
 from PySide6.QtWidgets import (
     QApplication,
     QFileDialog,
-    QGraphicsDropShadowEffect,
     QLineEdit,
     QMainWindow,
     QMessageBox,
@@ -27,23 +27,36 @@ from .dialogs import (
     VideoSettingsDialog,
 )
 from .icons import (
+    icon_close,
     icon_exit_fullscreen,
     icon_fullscreen,
     icon_maximize,
+    icon_minus,
     icon_next_track,
+    icon_open_folder,
     icon_pause,
     icon_play,
+    icon_playlist,
+    icon_plus,
     icon_prev_track,
     icon_repeat,
     icon_restore,
+    icon_restore_playlist,
+    icon_save,
+    icon_search,
+    icon_settings,
     icon_shuffle,
+    icon_sort,
     icon_stop,
+    icon_trash,
     icon_volume,
     icon_volume_muted,
 )
 from .menus import create_main_context_menu, create_playlist_context_menu
+from .widgets import PanelShadow
 from ..i18n import tr
 from ..mpv_power_config import ensure_mpv_power_user_layout
+from ..playlist import _cached_extract_info, _media_filter_string
 from ..settings import (
     load_sub_delay_for_file,
     load_equalizer_settings,
@@ -71,8 +84,212 @@ except ImportError:
     yt_dlp = None
 
 YTDLP_REMOTE_COMPONENTS = "ejs:github"
+
+
+def _set_geometry_if_changed(widget: QWidget, x: int, y: int, w: int, h: int) -> None:
+    # setGeometry dirties the region even when nothing moved.
+    rect = widget.geometry()
+    if rect.x() != x or rect.y() != y or rect.width() != w or rect.height() != h:
+        widget.setGeometry(x, y, w, h)
+
+
+_FOCUS_INVALIDATING_EVENTS = (
+    QEvent.ActivationChange,
+    QEvent.WindowActivate,
+    QEvent.WindowDeactivate,
+    QEvent.ApplicationStateChange,
+)
+_ICON_FACTORIES = {
+    "play": icon_play,
+    "pause": icon_pause,
+    "prev_track": icon_prev_track,
+    "next_track": icon_next_track,
+    "stop": icon_stop,
+    "volume": icon_volume,
+    "volume_muted": icon_volume_muted,
+    "fullscreen": icon_fullscreen,
+    "exit_fullscreen": icon_exit_fullscreen,
+    "maximize": icon_maximize,
+    "restore": icon_restore,
+    "minus": icon_minus,
+    "close": icon_close,
+    "plus": icon_plus,
+    "playlist": icon_playlist,
+    "settings": icon_settings,
+    "search": icon_search,
+    "open_folder": icon_open_folder,
+    "save": icon_save,
+    "restore_playlist": icon_restore_playlist,
+    "sort": icon_sort,
+    "trash": icon_trash,
+}
+# Only the gain varies per band, so the per-band filter text is built once.
+_EQ_TEMPLATES = tuple(
+    f"equalizer=f={f}:width_type=o:w=1:g={{}}"
+    for f in (31, 62, 125, 250, 500, 1000, 2000, 4000, 8000, 16000)
+)
 YTDLP_FMT_PREFIX = "fmt:"
 
+# Plain ints so the keyPressEvent cascade compares without enum attribute lookups.
+_K_ESCAPE = int(Qt.Key_Escape)
+_K_ENTER = int(Qt.Key_Enter)
+_K_RETURN = int(Qt.Key_Return)
+_K_DELETE = int(Qt.Key_Delete)
+_K_O = int(Qt.Key_O)
+_K_L = int(Qt.Key_L)
+_K_RIGHT = int(Qt.Key_Right)
+_K_LEFT = int(Qt.Key_Left)
+_K_UP = int(Qt.Key_Up)
+_K_DOWN = int(Qt.Key_Down)
+_K_PAGE_UP = int(Qt.Key_PageUp)
+_K_PAGE_DOWN = int(Qt.Key_PageDown)
+_K_F4 = int(Qt.Key_F4)
+_K_SPACE = int(Qt.Key_Space)
+_K_F = int(Qt.Key_F)
+_K_PERIOD = int(Qt.Key_Period)
+_K_COMMA = int(Qt.Key_Comma)
+_K_BRACKET_RIGHT = int(Qt.Key_BracketRight)
+_K_BRACKET_LEFT = int(Qt.Key_BracketLeft)
+_K_M = int(Qt.Key_M)
+_K_S = int(Qt.Key_S)
+_K_P = int(Qt.Key_P)
+_K_V = int(Qt.Key_V)
+_K_PLUS = int(Qt.Key_Plus)
+_K_EQUAL = int(Qt.Key_Equal)
+_K_MINUS = int(Qt.Key_Minus)
+_K_0 = int(Qt.Key_0)
+_K_4 = int(Qt.Key_4)
+_K_6 = int(Qt.Key_6)
+_K_8 = int(Qt.Key_8)
+_K_2 = int(Qt.Key_2)
+_K_B = int(Qt.Key_B)
+_K_R = int(Qt.Key_R)
+_K_X = int(Qt.Key_X)
+_K_Y = int(Qt.Key_Y)
+_K_G = int(Qt.Key_G)
+_K_H = int(Qt.Key_H)
+_K_J = int(Qt.Key_J)
+_K_K = int(Qt.Key_K)
+_K_I = int(Qt.Key_I)
+_K_U = int(Qt.Key_U)
+
+
+def _optional_qt_key(name: str):
+    value = getattr(Qt, name, None)
+    return int(value) if value is not None else None
+
+
+_K_MEDIA_TOGGLE_PLAY_PAUSE = _optional_qt_key("Key_MediaTogglePlayPause")
+_K_MEDIA_PLAY = _optional_qt_key("Key_MediaPlay")
+_K_MEDIA_PAUSE = _optional_qt_key("Key_MediaPause")
+_K_MEDIA_NEXT = _optional_qt_key("Key_MediaNext")
+_K_MEDIA_PREVIOUS = _optional_qt_key("Key_MediaPrevious")
+_K_MEDIA_STOP = _optional_qt_key("Key_MediaStop")
+
+_APP_SHORTCUT_KEYS = frozenset({
+    _K_ESCAPE,
+    _K_RIGHT,
+    _K_LEFT,
+    _K_UP,
+    _K_DOWN,
+    _K_PAGE_UP,
+    _K_PAGE_DOWN,
+    _K_F4,
+    _K_SPACE,
+    _K_ENTER,
+    _K_RETURN,
+    _K_F,
+    _K_DELETE,
+    _K_PERIOD,
+    _K_COMMA,
+    _K_BRACKET_RIGHT,
+    _K_BRACKET_LEFT,
+    _K_PLUS,
+    _K_EQUAL,
+    _K_MINUS,
+    _K_0,
+    _K_2,
+    _K_4,
+    _K_6,
+    _K_8,
+    _K_B,
+    _K_M,
+    _K_S,
+    _K_P,
+    _K_V,
+    _K_R,
+    _K_G,
+    _K_H,
+    _K_J,
+    _K_K,
+    _K_I,
+    _K_U,
+    _K_O,
+    _K_L,
+    _K_X,
+    _K_Y,
+})
+
+_PAN_SHORTCUTS = {
+    _K_4: ("video_pan_x", 0.05, "Pan Left"),
+    _K_6: ("video_pan_x", -0.05, "Pan Right"),
+    _K_8: ("video_pan_y", 0.05, "Pan Up"),
+    _K_2: ("video_pan_y", -0.05, "Pan Down"),
+}
+# Shortcut groups in priority order; a key tries only the groups that list it.
+_SHORTCUT_GROUP_KEYS = (
+    ("_handle_open_shortcuts", (_K_O, _K_L)),
+    (
+        "_handle_transport_shortcuts",
+        (
+            _K_MEDIA_TOGGLE_PLAY_PAUSE,
+            _K_MEDIA_PLAY,
+            _K_MEDIA_PAUSE,
+            _K_MEDIA_NEXT,
+            _K_MEDIA_PREVIOUS,
+            _K_MEDIA_STOP,
+            _K_RIGHT,
+            _K_LEFT,
+            _K_UP,
+            _K_DOWN,
+            _K_PAGE_UP,
+            _K_PAGE_DOWN,
+            _K_F4,
+            _K_SPACE,
+            _K_ENTER,
+            _K_RETURN,
+            _K_F,
+            _K_DELETE,
+            _K_PERIOD,
+            _K_COMMA,
+            _K_BRACKET_RIGHT,
+            _K_BRACKET_LEFT,
+            _K_M,
+            _K_S,
+            _K_P,
+            _K_V,
+        ),
+    ),
+    ("_handle_zoom_shortcuts", (_K_PLUS, _K_EQUAL, _K_MINUS, _K_0)),
+    ("_handle_pan_shortcuts", tuple(_PAN_SHORTCUTS)),
+    ("_handle_brightness_shortcut", (_K_B,)),
+    ("_handle_rotation_shortcuts", (_K_R,)),
+    ("_handle_mirror_shortcuts", (_K_X, _K_Y)),
+    ("_handle_subtitle_runtime_shortcuts", (_K_S, _K_G, _K_H, _K_J, _K_K, _K_I, _K_U)),
+)
+
+
+def _build_key_shortcut_handlers() -> dict[int, tuple[str, ...]]:
+    table: dict[int, list[str]] = {}
+    for handler_name, keys in _SHORTCUT_GROUP_KEYS:
+        for key in keys:
+            if key is not None:
+                table.setdefault(key, []).append(handler_name)
+    return {key: tuple(names) for key, names in table.items()}
+
+
+_KEY_SHORTCUT_HANDLERS = _build_key_shortcut_handlers()
+
 
 def _is_youtube_url(url: str) -> bool:
     host = (urlparse(url).netloc or "").lower()
@@ -162,26 +379,27 @@ class UIEventsMixin:
     def update_transport_icons(self):
         if self._is_shutting_down:
             return
-        self.prev_btn.setIcon(icon_prev_track(22))
-        self.next_btn.setIcon(icon_next_track(22))
-        self.stop_btn.setIcon(icon_stop(22))
-        self.play_btn.setIcon(icon_play(22) if self._cached_paused else icon_pause(22))
+        self.prev_btn.setIcon(self._icon("prev_track", 22))
+        self.next_btn.setIcon(self._icon("next_track", 22))
+        self.stop_btn.setIcon(self._icon("stop", 22))
+        self.play_btn.setIcon(self._icon("play" if self._cached_paused else "pause", 22))
         self.prev_btn.setText("")
         self.next_btn.setText("")
         self.stop_btn.setText("")
         self.play_btn.setText("")
 
     def update_mute_icon(self):
-        pixmap = icon_volume_muted(22) if self._cached_muted else icon_volume(22)
-        self.mute_btn.setIcon(QIcon(pixmap))
+        icon = self._icon("volume_muted" if self._cached_muted else "volume", 22)
+        self.mute_btn.setIcon(icon)
         self.mute_btn.setText("")
         if hasattr(self, "popup_mute_btn"):
-            self.popup_mute_btn.setIcon(QIcon(pixmap))
+            self.popup_mute_btn.setIcon(icon)
             self.popup_mute_btn.setText("")
 
     def update_fullscreen_icon(self):
-        pixmap = icon_exit_fullscreen(24) if self.isFullScreen() else icon_fullscreen(24)
-        self.fullscreen_btn.setIcon(QIcon(pixmap))
+        self.fullscreen_btn.setIcon(
+            self._icon("exit_fullscreen" if self.isFullScreen() else "fullscreen", 24)
+        )
 
     def on_volume_changed(self, value: int):
         self.player.volume = value
@@ -190,21 +408,42 @@ class UIEventsMixin:
 
     def update_mode_buttons(self):
         self.shuffle_btn.setChecked(self.shuffle_enabled)
-        self.shuffle_btn.setIcon(QIcon(icon_shuffle(22, off=not self.shuffle_enabled)))
+        self.shuffle_btn.setIcon(self._icon("shuffle", 22, not self.shuffle_enabled))
 
         repeat_tip = (tr("Repeat Off"), tr("Repeat One"), tr("Repeat All"))[self.repeat_mode]
         self.repeat_btn.setToolTip(repeat_tip)
         self.repeat_btn.setChecked(self.repeat_mode != REPEAT_OFF)
         self.repeat_btn.setIcon(
-            QIcon(
-                icon_repeat(
-                    22,
-                    one=(self.repeat_mode == REPEAT_ONE),
-                    off=(self.repeat_mode == REPEAT_OFF),
-                )
-            )
+            self._icon("repeat", 22, self.repeat_mode == REPEAT_ONE, self.repeat_mode == REPEAT_OFF)
         )
 
+    def _icon(self, name: str, size: int, *state) -> QIcon:
+        # Icons are painted in Python; rasterize each (name, size, state) once.
+        key = (name, size) + state
+        icon = self._icon_cache.get(key)
+        if icon is None:
+            if name == "shuffle":
+                pixmap = icon_shuffle(size, off=state[0])
+            elif name == "repeat":
+                pixmap = icon_repeat(size, one=state[0], off=state[1])
+            else:
+                pixmap = _ICON_FACTORIES[name](size)
+            icon = QIcon(pixmap)
+            self._icon_cache[key] = icon
+        return icon
+
+    def _prewarm_icon_cache(self):
+        for name in ("prev_track", "next_track", "stop", "play", "pause", "volume", "volume_muted"):
+            self._icon(name, 22)
+        for name in ("fullscreen", "exit_fullscreen"):
+            self._icon(name, 24)
+        for name in ("maximize", "restore"):
+            self._icon(name, 18)
+        for off in (False, True):
+            self._icon("shuffle", 22, off)
+        for one, off in ((False, True), (True, False), (False, False)):
+            self._icon("repeat", 22, one, off)
+
     def show_settings_menu(self):
         menu = create_main_context_menu(self, QPoint())
         if menu:
@@ -216,11 +455,10 @@ class UIEventsMixin:
     def _exec_menu_on_top(self, menu: QMenu, global_pos: QPoint):
         if not menu:
             return None
-        had_title_bar = bool(hasattr(self, "title_bar") and self.title_bar.isVisible())
+        had_title_bar = self.title_bar is not None and self.title_bar.isVisible()
         self._context_menu_open = True
-        mouse_timer_was_active = bool(hasattr(self, "mouse_timer") and self.mouse_timer.isActive())
-        if mouse_timer_was_active:
-            self.mouse_timer.stop()
+        mouse_poll_was_suspended = bool(getattr(self, "_mouse_poll_suspended", False))
+        self._mouse_poll_suspended = True
         if had_title_bar:
             self.title_bar.hide()
         try:
@@ -233,9 +471,10 @@ class UIEventsMixin:
             return menu.exec(global_pos)
         finally:
             self._context_menu_open = False
-            if mouse_timer_was_active:
-                self.mouse_timer.start()
-            if had_title_bar:
+            self._mouse_poll_suspended = mouse_poll_was_suspended
+            # Rapid menu re-opens share one pending restore instead of queueing several.
+            if had_title_bar and not self._title_restore_pending:
+                self._title_restore_pending = True
                 QTimer.singleShot(0, self._restore_title_bar_after_menu)
 
     def _prepare_modal_window(self, widget):
@@ -286,7 +525,8 @@ class UIEventsMixin:
         return QMessageBox.StandardButton(self._exec_modal(box))
 
     def _restore_title_bar_after_menu(self):
-        if not hasattr(self, "title_bar"):
+        self._title_restore_pending = False
+        if self.title_bar is None:
             return
         if QApplication.activeModalWidget() is not None:
             return
@@ -297,15 +537,15 @@ class UIEventsMixin:
         self.title_bar.raise_()
 
     def _sync_title_bar_geometry(self):
-        if not hasattr(self, "title_bar") or self.isMinimized():
+        if self.title_bar is None or self.isMinimized():
             return
         width = self.width()
         height = 32
         pos = self.mapToGlobal(QPoint(0, 0))
-        self.title_bar.setGeometry(pos.x(), pos.y(), width, height)
+        _set_geometry_if_changed(self.title_bar, pos.x(), pos.y(), width, height)
 
     def _should_show_title_bar(self, local_pos: QPoint) -> bool:
-        if not hasattr(self, "title_bar"):
+        if self.title_bar is None:
             return False
         if self._context_menu_open or not self._is_app_focused():
             return False
@@ -317,25 +557,27 @@ class UIEventsMixin:
         return local_pos.y() < threshold
 
     def _is_app_focused(self) -> bool:
+        cached = self._cached_focus_state
+        if cached is not None:
+            return cached
         if self.isMinimized():
-            return False
-        if self.isActiveWindow():
-            return True
-        active_win = QApplication.activeWindow()
-        if active_win is None:
-            try:
-                return self.rect().contains(self.mapFromGlobal(QCursor.pos()))
-            except RuntimeError:
-                return False
-        app_windows = [self] + [
-            getattr(self, attr)
-            for attr in ["title_bar", "overlay", "playlist_overlay", "speed_overlay"]
-            if hasattr(self, attr)
-        ]
-        return any(
-            active_win == win or win.isAncestorOf(active_win)
-            for win in app_windows
-        )
+            focused = False
+        elif self.isActiveWindow():
+            focused = True
+        else:
+            active_win = QApplication.activeWindow()
+            if active_win is None:
+                # Depends on the cursor position, so never cached.
+                try:
+                    return self.rect().contains(self.mapFromGlobal(QCursor.pos()))
+                except RuntimeError:
+                    return False
+            focused = any(
+                active_win is win or win.isAncestorOf(active_win)
+                for win in self._owned_windows
+            )
+        self._cached_focus_state = focused
+        return focused
 
     def _sync_overlay_geometry(self):
         if not hasattr(self, "overlay"):
@@ -352,11 +594,11 @@ class UIEventsMixin:
         x = geometry.x() + (self.width() - overlay_w) // 2
         y = geometry.y() + geometry.height() - height - pad
 
-        self.overlay.setGeometry(x, y, overlay_w, height)
-        self.overlay.panel.setGeometry(inset, 0, pill_w, height)
+        _set_geometry_if_changed(self.overlay, x, y, overlay_w, height)
+        _set_geometry_if_changed(self.overlay.panel, inset, 0, pill_w, height)
 
     def _sync_playlist_overlay_geometry(self):
-        if not hasattr(self, "playlist_overlay"):
+        if self.playlist_overlay is None:
             return
 
         width = 400
@@ -366,8 +608,8 @@ class UIEventsMixin:
         x = geometry.x() + geometry.width() - width
         y = geometry.y()
 
-        self.playlist_overlay.setGeometry(x, y, width, height)
-        self.playlist_overlay.panel.setGeometry(0, 0, width, height)
+        _set_geometry_if_changed(self.playlist_overlay, x, y, width, height)
+        _set_geometry_if_changed(self.playlist_overlay.panel, 0, 0, width, height)
 
     def _sync_speed_indicator_geometry(self):
         if not hasattr(self, "speed_overlay"):
@@ -384,9 +626,9 @@ class UIEventsMixin:
         geometry = self.geometry()
         x = geometry.x() + inner_x
         global_y = geometry.y() + y
-        self.speed_overlay.setGeometry(x, global_y, width, height)
-        self.speed_overlay.panel.setGeometry(0, 0, width, height)
-        self.speed_overlay.label.setGeometry(0, 0, width, height)
+        _set_geometry_if_changed(self.speed_overlay, x, global_y, width, height)
+        _set_geometry_if_changed(self.speed_overlay.panel, 0, 0, width, height)
+        _set_geometry_if_changed(self.speed_overlay.label, 0, 0, width, height)
 
     def _enforce_overlay_stack(self):
         if not getattr(self, "always_on_top", False):
@@ -425,15 +667,32 @@ class UIEventsMixin:
                 pass
 
     def _set_mouse_poll_interval(self, interval_ms: int) -> None:
-        if not hasattr(self, "mouse_timer"):
+        self._mouse_poll_interval_ms = max(50, int(interval_ms))
+
+    def _on_main_tick(self):
+        # Single UI heartbeat: cursor/overlay polling at its adaptive rate, then timeline refresh.
+        self._mouse_poll_elapsed_ms += self.ui_timer.interval()
+        if not self._mouse_poll_suspended and self._mouse_poll_elapsed_ms >= self._mouse_poll_interval_ms:
+            self._mouse_poll_step_ms = self._mouse_poll_elapsed_ms
+            self._mouse_poll_elapsed_ms = 0
+            self.check_mouse_pos()
+        self.force_ui_update()
+
+    def _on_pointer_event(self):
+        if self._mouse_poll_suspended:
+            return
+        now = time.monotonic()
+        if now - self._last_pointer_event_check < self._pointer_event_min_interval:
             return
-        target = max(50, int(interval_ms))
-        if self.mouse_timer.interval() != target:
-            self.mouse_timer.setInterval(target)
+        self._last_pointer_event_check = now
+        # The cursor moved, so no idle time accrues; restart the tick countdown from here.
+        self._mouse_poll_step_ms = 0
+        self._mouse_poll_elapsed_ms = 0
+        self.check_mouse_pos()
 
     def check_mouse_pos(self):
         if self.isMinimized():
-            self._set_mouse_poll_interval(getattr(self, "_mouse_timer_slow_interval", 180))
+            self._set_mouse_poll_interval(self._mouse_timer_idle_interval)
             for attr in ("title_bar", "overlay", "playlist_overlay", "speed_overlay"):
                 win = getattr(self, attr, None)
                 if win and win.isVisible():
@@ -442,8 +701,8 @@ class UIEventsMixin:
                 self.resize_corner_hint.hide()
             return
         if not self._is_app_focused():
-            self._set_mouse_poll_interval(getattr(self, "_mouse_timer_slow_interval", 180))
-            if hasattr(self, "title_bar") and self.title_bar.isVisible():
+            self._set_mouse_poll_interval(self._mouse_timer_idle_interval)
+            if self.title_bar is not None and self.title_bar.isVisible():
                 self.title_bar.hide()
             if hasattr(self, "resize_corner_hint"):
                 self.resize_corner_hint.hide()
@@ -455,7 +714,7 @@ class UIEventsMixin:
         global_pos = QCursor.pos()
         local_pos = self.mapFromGlobal(global_pos)
         volume_popup_active = hasattr(self, "volume_popup") and self.volume_popup.isVisible()
-        poll_step = self.mouse_timer.interval() if hasattr(self, "mouse_timer") else 100
+        poll_step = getattr(self, "_mouse_poll_step_ms", 100)
         cursor_moved = global_pos != self.last_cursor_global_pos
 
         margin = 20
@@ -533,13 +792,15 @@ class UIEventsMixin:
                 self.playlist_overlay.show()
                 self.playlist_overlay.raise_()
         elif self.rect().contains(local_pos) and local_pos.x() > (self.width() - 20):
-            is_title_bar_visible = hasattr(self, "title_bar") and self.title_bar.isVisible()
+            is_title_bar_visible = self.title_bar is not None and self.title_bar.isVisible()
             if not self.playlist_overlay.isVisible() and not is_title_bar_visible:
                 self._sync_playlist_overlay_geometry()
                 self.playlist_overlay.show()
                 self.playlist_overlay.raise_()
-                self.playlist_widget.updateGeometries()
-                QTimer.singleShot(1, self.playlist_widget.update)
+                if not self._playlist_first_show_done:
+                    # The very first reveal can paint before the list has laid out.
+                    self._playlist_first_show_done = True
+                    QTimer.singleShot(0, self.playlist_overlay.panel.update)
 
         if self.playlist_overlay.isVisible() and not self.pinned_playlist:
             if getattr(self, "_playlist_drag_reveal_active", False):
@@ -578,36 +839,61 @@ class UIEventsMixin:
         target_interval = (
             getattr(self, "_mouse_timer_fast_interval", 100)
             if cursor_moved or transient_ui_active
-            else getattr(self, "_mouse_timer_slow_interval", 180)
+            else getattr(self, "_mouse_timer_slow_interval", 200)
         )
         self._set_mouse_poll_interval(target_interval)
 
     def resizeEvent(self, event):
-        self.video_container.setGeometry(0, 0, self.width(), self.height())
-        self.background_widget.setGeometry(0, 0, self.width(), self.height())
+        width = self.width()
+        height = self.height()
+        _set_geometry_if_changed(self.video_container, 0, 0, width, height)
+        _set_geometry_if_changed(self.background_widget, 0, 0, width, height)
         if hasattr(self, "resize_corner_hint"):
-            self.resize_corner_hint.move(
-                max(0, self.video_container.width() - self.resize_corner_hint.width()),
-                max(0, self.video_container.height() - self.resize_corner_hint.height()),
+            hint = self.resize_corner_hint
+            _set_geometry_if_changed(
+                hint,
+                max(0, self.video_container.width() - hint.width()),
+                max(0, self.video_container.height() - hint.height()),
+                hint.width(),
+                hint.height(),
             )
-        self._sync_overlay_geometry()
-        self._sync_playlist_overlay_geometry()
-        self._sync_speed_indicator_geometry()
-        self._sync_title_bar_geometry()
-        self._enforce_overlay_stack()
+        self._schedule_geometry_syncs()
         QMainWindow.resizeEvent(self, event)
 
     def moveEvent(self, event):
+        self._schedule_geometry_syncs()
+        QMainWindow.moveEvent(self, event)
+
+    def _schedule_geometry_syncs(self):
+        timer = getattr(self, "_geometry_sync_timer", None)
+        if timer is None:
+            self._do_geometry_syncs()
+            return
+        # Leading edge syncs at once; the rest of a drag/resize burst collapses into one trailing sync.
+        if timer.isActive():
+            self._geometry_sync_pending = True
+        else:
+            self._do_geometry_syncs()
+            self._geometry_sync_pending = False
+        timer.start()
+
+    def _on_geometry_sync_timeout(self):
+        if self._geometry_sync_pending:
+            self._geometry_sync_pending = False
+            self._do_geometry_syncs()
+
+    def _do_geometry_syncs(self):
         self._sync_overlay_geometry()
         self._sync_playlist_overlay_geometry()
         self._sync_speed_indicator_geometry()
         self._sync_title_bar_geometry()
         self._enforce_overlay_stack()
-        QMainWindow.moveEvent(self, event)
 
     def changeEvent(self, event):
+        if event.type() in (QEvent.ActivationChange, QEvent.WindowStateChange):
+            self._cached_focus_state = None
         if event.type() == QEvent.ActivationChange:
-            if not self._is_app_focused() and hasattr(self, "title_bar"):
+            if not self._is_app_focused() and self.title_bar is not None:
                 self.title_bar.hide()
 
         if event.type() == QEvent.WindowStateChange:
@@ -619,11 +905,11 @@ class UIEventsMixin:
                         win.hide()
                 if hasattr(self, "volume_popup") and self.volume_popup.isVisible():
                     self.volume_popup.hide()
-            if hasattr(self, "title_bar"):
+            if self.title_bar is not None:
                 if self.isMaximized():
-                    self.title_bar.max_btn.setIcon(QIcon(icon_restore(18)))
+                    self.title_bar.max_btn.setIcon(self._icon("restore", 18))
                 else:
-                    self.title_bar.max_btn.setIcon(QIcon(icon_maximize(18)))
+                    self.title_bar.max_btn.setIcon(self._icon("maximize", 18))
 
         QMainWindow.changeEvent(self, event)
 
@@ -638,10 +924,10 @@ class UIEventsMixin:
             return
         if self.isMaximized():
             self.showNormal()
-            self.title_bar.max_btn.setIcon(QIcon(icon_maximize(18)))
+            self.title_bar.max_btn.setIcon(self._icon("maximize", 18))
         else:
             self.showMaximized()
-            self.title_bar.max_btn.setIcon(QIcon(icon_restore(18)))
+            self.title_bar.max_btn.setIcon(self._icon("restore", 18))
 
     def toggle_pin_controls(self):
         self.pinned_controls = not self.pinned_controls
@@ -666,25 +952,26 @@ class UIEventsMixin:
 
     def show_add_menu(self):
         self._exec_menu_on_top(
-            self.add_menu,
+            self._ensure_add_menu(),
             self.add_btn.mapToGlobal(self.add_btn.rect().bottomLeft()),
         )
 
     def show_add_menu_main(self):
+        menu = self._ensure_add_menu()
         pos = self.add_main_btn.mapToGlobal(self.add_main_btn.rect().topLeft())
-        pos.setY(pos.y() - self.add_menu.sizeHint().height())
-        self._exec_menu_on_top(self.add_menu, pos)
+        pos.setY(pos.y() - menu.sizeHint().height())
+        self._exec_menu_on_top(menu, pos)
 
     def apply_panel_shadow(self, panel: QWidget, blur: int, offset_y: int):
-        shadow = QGraphicsDropShadowEffect(panel)
-        shadow.setBlurRadius(blur)
-        shadow.setOffset(0, offset_y)
-        shadow.setColor(QColor(0, 0, 0, 180))
-        panel.setGraphicsEffect(shadow)
+        # Cached 9-slice pixmap painted behind the panel; no live graphics effect.
+        existing = getattr(panel, "_shadow_layer", None)
+        if existing is not None:
+            existing.deleteLater()
+        panel._shadow_layer = PanelShadow(panel, blur, offset_y, QColor(0, 0, 0, 180))
 
     def mouseDoubleClickEvent(self, event):
         if event.button() == Qt.LeftButton:
-            if hasattr(self, "playlist_overlay") and self.playlist_overlay.isVisible():
+            if self.playlist_overlay is not None and self.playlist_overlay.isVisible():
                 return QMainWindow.mouseDoubleClickEvent(self, event)
 
             pos = event.position().toPoint()
@@ -846,13 +1133,13 @@ class UIEventsMixin:
             return
         self._fullscreen_transition_active = True
 
-        if hasattr(self, "title_bar"):
+        if self.title_bar is not None:
             self.title_bar.hide()
         if hasattr(self, "overlay"):
             self.overlay.hide()
         if hasattr(self, "volume_popup") and self.volume_popup.isVisible():
             self.volume_popup.hide()
-        if hasattr(self, "playlist_overlay") and not self.pinned_playlist:
+        if self.playlist_overlay is not None and not self.pinned_playlist:
             self.playlist_overlay.hide()
 
         target_fullscreen = not self.isFullScreen()
@@ -986,10 +1273,10 @@ class UIEventsMixin:
 
     def change_speed_step(self, direction: int):
         current = self._safe_player_float("speed", 1.0)
-        closest = min(
-            range(len(SPEED_STEPS)),
-            key=lambda idx: abs(SPEED_STEPS[idx] - current),
-        )
+        # SPEED_STEPS is sorted; the nearest step is one of the two around the insertion point.
+        closest = min(bisect_left(SPEED_STEPS, current), len(SPEED_STEPS) - 1)
+        if closest > 0 and abs(SPEED_STEPS[closest - 1] - current) <= abs(SPEED_STEPS[closest] - current):
+            closest -= 1
         target = max(0, min(len(SPEED_STEPS) - 1, closest + direction))
         self.set_playback_speed(SPEED_STEPS[target])
 
@@ -1025,12 +1312,25 @@ class UIEventsMixin:
     def seek_relative(self, seconds: int):
         if self.current_index < 0:
             return
+        # Accumulate auto-repeat steps and issue one mpv seek per flush.
+        self._pending_seek += int(seconds)
+        if not self._seek_timer.isActive():
+            self._seek_timer.start(16)
+
+    def _flush_pending_seek(self):
+        seconds = self._pending_seek
+        if not seconds or self.current_index < 0:
+            self._pending_seek = 0
+            return
         now = time.monotonic()
-        if (now - self._last_seek_cmd_time) < 0.08:
+        wait_sec = 0.08 - (now - self._last_seek_cmd_time)
+        if wait_sec > 0:
+            self._seek_timer.start(max(1, int(wait_sec * 1000)))
             return
+        self._pending_seek = 0
         self._last_seek_cmd_time = now
         try:
-            self.player.command("seek", int(seconds), "relative")
+            self.player.command("seek", seconds, "relative")
             if (now - self._last_track_switch_time) > 0.2:
                 self.show_status_overlay(tr("Seek {}s").format(seconds))
         except Exception:
@@ -1123,28 +1423,54 @@ class UIEventsMixin:
                 lang_code.upper()
             ),
         )
+        self._refresh_status_templates()
+        _media_filter_string.cache_clear()
         self.update_mode_buttons()
         self.update_transport_icons()
         self.update_mute_icon()
 
+    def _refresh_status_templates(self):
+        # Resolved once per language so auto-repeat shortcuts skip the tr() lookup.
+        self._fmt_zoom = tr("Zoom: {}")
+        self._fmt_brightness = tr("Brightness: {}")
+        self._fmt_sub_delay = tr("Delay: {}s")
+        self._fmt_sub_size = tr("Size: {}")
+        self._fmt_sub_pos = tr("Pos: {}")
+
     def apply_equalizer_settings(self):
+        self._eq_apply_timer.stop()
         data = load_equalizer_settings()
+        self._eq_cache = data
+        self._apply_equalizer_af(data)
+
+    def _apply_cached_equalizer(self):
+        if self._eq_cache is None:
+            self.apply_equalizer_settings()
+            return
+        self._apply_equalizer_af(self._eq_cache)
+
+    def _apply_equalizer_af(self, data):
         try:
-            if data["enabled"]:
-                freqs = [31, 62, 125, 250, 500, 1000, 2000, 4000, 8000, 16000]
-                gains = data["gains"]
-                af_str = ",".join(
-                    f"equalizer=f={f}:width_type=o:w=1:g={g}"
-                    for f, g in zip(freqs, gains)
-                )
+            enabled = bool(data["enabled"])
+            gains = tuple(data["gains"]) if enabled else ()
+            af_key = (enabled, gains)
+            # Setting af rebuilds mpv's filter chain, so identical chains are not re-sent.
+            if af_key == self._last_af_key:
+                return
+            if enabled:
+                af_str = ",".join(t.format(g) for t, g in zip(_EQ_TEMPLATES, gains))
                 self.player.af = af_str
             else:
                 self.player.af = ""
+            self._last_af_key = af_key
         except (KeyError, TypeError, ValueError, RuntimeError) as e:
             logging.warning("Apply EQ error: %s", e)
 
     def update_equalizer_gains(self, gains):
-        self.apply_equalizer_settings()
+        # The dialog only sends gains while enabled; keep them in memory instead of re-reading settings.
+        self._eq_cache = {"enabled": True, "gains": list(gains)}
+        # Slider drags arrive per step; apply once the drag pauses.
+        self._eq_apply_timer.start()
 
     def apply_video_settings(self):
         config = load_video_settings()
@@ -1175,29 +1501,24 @@ class UIEventsMixin:
             logging.warning("Error applying video settings: %s", e)
 
     def _read_video_dimensions(self) -> tuple[int, int] | None:
-        candidates: list[tuple[int, int]] = []
-        try:
-            dw = int(self.player.dwidth or 0)
-            dh = int(self.player.dheight or 0)
-            candidates.append((dw, dh))
-        except Exception:
-            pass
-        try:
-            w = int(self.player.width or 0)
-            h = int(self.player.height or 0)
-            candidates.append((w, h))
-        except Exception:
-            pass
+        # One node read usually answers this; the scalar properties are only a fallback.
         for prop in ("video-out-params", "video-params"):
             try:
                 params = self.player.command("get_property_native", prop)
-                if isinstance(params, dict):
-                    w = int(params.get("dw") or params.get("w") or 0)
-                    h = int(params.get("dh") or params.get("h") or 0)
-                    candidates.append((w, h))
+                if not isinstance(params, dict):
+                    continue
+                w = int(params.get("dw") or params.get("w") or 0)
+                h = int(params.get("dh") or params.get("h") or 0)
             except Exception:
-                pass
-        for w, h in candidates:
+                continue
+            if w > 0 and h > 0:
+                return (w, h)
+        for w_prop, h_prop in (("dwidth", "dheight"), ("width", "height")):
+            try:
+                w = int(getattr(self.player, w_prop) or 0)
+                h = int(getattr(self.player, h_prop) or 0)
+            except Exception:
+                continue
             if w > 0 and h > 0:
                 return (w, h)
         return None
@@ -1284,6 +1605,70 @@ class UIEventsMixin:
                 self._set_mpv_property_safe("video_zoom", 0.0, min_interval_sec=0.05)
             return
 
+        screen_rect = self._available_screen_rect()
+        sync_key = (
+            int(dims[0]),
+            int(dims[1]),
+            self._video_rotate_deg,
+            self._aspect_ratio_setting,
+            self.window_zoom,
+            screen_rect.width(),
+            screen_rect.height(),
+        )
+        # Same inputs give the same geometry; only the Qt/mpv writes below are repeated.
+        cached = self._sync_size_cache
+        if cached is not None and cached[0] == sync_key:
+            _, target_w, target_h, video_zoom = cached
+        else:
+            target_w, target_h, video_zoom = self._compute_sync_target(dims, screen_rect)
+            self._sync_size_cache = (sync_key, target_w, target_h, video_zoom)
+
+        new_w, new_h = int(round(target_w)), int(round(target_h))
+        if self.width() != new_w or self.height() != new_h:
+            self.resize(new_w, new_h)
+
+        if video_zoom is not None:
+            self._set_mpv_property_safe("video_zoom", video_zoom, min_interval_sec=0.05)
+            if not video_zoom:
+                self._set_mpv_property_safe("video_pan_x", 0.0, min_interval_sec=0.05)
+                self._set_mpv_property_safe("video_pan_y", 0.0, min_interval_sec=0.05)
+
+        new_geometry = self.geometry()
+        if not screen_rect.contains(new_geometry):
+            self.move(
+                max(screen_rect.left(), min(new_geometry.left(), screen_rect.right() - new_geometry.width())),
+                max(screen_rect.top(), min(new_geometry.top(), screen_rect.bottom() - new_geometry.height())),
+            )
+
+    def _available_screen_rect(self):
+        rect = self._cached_screen_rect
+        if rect is not None:
+            return rect
+        screen = self.screen()
+        rect = screen.availableGeometry()
+        handle = self.windowHandle()
+        if handle is None:
+            # No native window yet, so no screenChanged to invalidate a cached value.
+            return rect
+        if not self._screen_rect_hooked:
+            handle.screenChanged.connect(self._invalidate_screen_rect)
+            self._screen_rect_hooked = True
+        if screen is not self._screen_rect_source:
+            if self._screen_rect_source is not None:
+                try:
+                    self._screen_rect_source.availableGeometryChanged.disconnect(self._invalidate_screen_rect)
+                except (RuntimeError, TypeError):
+                    pass
+            screen.availableGeometryChanged.connect(self._invalidate_screen_rect)
+            self._screen_rect_source = screen
+        self._cached_screen_rect = rect
+        return rect
+
+    def _invalidate_screen_rect(self, *_args):
+        self._cached_screen_rect = None
+
+    def _compute_sync_target(self, dims, screen_rect) -> tuple[float, float, float | None]:
+        # Returns (target_w, target_h, video_zoom); video_zoom is None when no zoom write applies.
         w, h = int(dims[0]), int(dims[1])
         rotate = int(self._video_rotate_deg or 0) % 360
         if rotate in {90, 270}:
@@ -1302,20 +1687,22 @@ class UIEventsMixin:
                 except (TypeError, ValueError):
                     pass
 
-        try:
-            zoom_factor = 2 ** self.window_zoom
-        except (TypeError, ValueError, OverflowError):
-            zoom_factor = 1.0
+        zoom_factor = 1.0
+        if self.window_zoom:
+            try:
+                zoom_factor = 2.0 ** self.window_zoom
+            except (TypeError, ValueError, OverflowError):
+                zoom_factor = 1.0
 
-        screen_rect = self.screen().availableGeometry()
-        clamped_base_h = min(base_h, screen_rect.height() * 0.7)
+        screen_h = screen_rect.height()
+        clamped_base_h = min(base_h, screen_h * 0.7)
         ideal_h = clamped_base_h * zoom_factor
         ideal_w = ideal_h * effective_aspect
 
         target_w = ideal_w
         target_h = ideal_h
 
-        limit_h = screen_rect.height() * 0.9
+        limit_h = screen_h * 0.9
         if target_h > limit_h:
             target_h = limit_h
             target_w = target_h * effective_aspect
@@ -1326,27 +1713,12 @@ class UIEventsMixin:
             if effective_aspect > 0:
                 target_h = target_w / effective_aspect
 
-        self.resize(int(round(target_w)), int(round(target_h)))
-
-        if target_h > 0:
-            overflow_scale = ideal_h / target_h
-            if abs(overflow_scale - 1.0) > 0.001:
-                self._set_mpv_property_safe(
-                    "video_zoom",
-                    math.log2(overflow_scale),
-                    min_interval_sec=0.05,
-                )
-            else:
-                self._set_mpv_property_safe("video_zoom", 0.0, min_interval_sec=0.05)
-                self._set_mpv_property_safe("video_pan_x", 0.0, min_interval_sec=0.05)
-                self._set_mpv_property_safe("video_pan_y", 0.0, min_interval_sec=0.05)
-
-        new_geometry = self.geometry()
-        if not screen_rect.contains(new_geometry):
-            self.move(
-                max(screen_rect.left(), min(new_geometry.left(), screen_rect.right() - new_geometry.width())),
-                max(screen_rect.top(), min(new_geometry.top(), screen_rect.bottom() - new_geometry.height())),
-            )
+        if target_h <= 0:
+            return target_w, target_h, None
+        overflow_scale = ideal_h / target_h
+        if abs(overflow_scale - 1.0) > 0.001:
+            return target_w, target_h, math.log2(overflow_scale)
+        return target_w, target_h, 0.0
 
     def _process_pending_resize_check(self, now: float) -> bool:
         if not self._pending_resize_check:
@@ -1430,6 +1802,10 @@ class UIEventsMixin:
         if not math.isfinite(duration):
             return
         path = str(self.playlist[self.current_index])
+        dur_str = format_duration(duration)
+        if self.playlist_durations.get(path) == dur_str:
+            # Nothing to update; skip the mpv path read and path normalization for this tick.
+            return
         allow_runtime_duration = True
         if not is_stream_url(path):
             loaded_path = ""
@@ -1450,12 +1826,10 @@ class UIEventsMixin:
                     allow_runtime_duration = False
         if not allow_runtime_duration:
             return
-        dur_str = format_duration(duration)
-        if self.playlist_durations.get(path) != dur_str:
-            self.playlist_durations[path] = dur_str
-            self.playlist_raw_durations[path] = duration
-            if hasattr(self, "playlist_model"):
-                self.playlist_model.update_duration(path, dur_str)
+        self.playlist_durations[path] = dur_str
+        self.playlist_raw_durations[path] = duration
+        if self.playlist_model is not None:
+            self.playlist_model.update_duration(path, dur_str)
 
     def _should_advance_after_end(self, now: float, position, duration, suppress_end_advance: bool) -> bool:
         is_at_end = False
@@ -1510,12 +1884,29 @@ class UIEventsMixin:
         if not self.seek_slider.isSliderDown():
             safe_duration = max(0, int(duration))
             safe_position = max(0, min(safe_duration, int(position)))
-            self.seek_slider.setRange(0, safe_duration)
-            self.seek_slider.setValue(safe_position)
+            # Compare against the slider itself: clicks and drags move it without going through here.
+            slider = self.seek_slider
+            if slider.maximum() != safe_duration or slider.value() != safe_position:
+                # Programmatic updates stay silent; seeking is driven by sliderMoved only.
+                blocked = slider.blockSignals(True)
+                if slider.maximum() != safe_duration:
+                    slider.setRange(0, safe_duration)
+                slider.setValue(safe_position)
+                slider.blockSignals(blocked)
+        # Chapter marker state only needs half-second resolution; the label has whole seconds.
+        timeline_key = (int(position * 2), int(duration * 2))
+        if timeline_key == self._timeline_key:
+            return
+        self._timeline_key = timeline_key
         self.seek_slider.set_current_time(float(position))
-        current_str = format_duration(position)
-        duration_str = format_duration(duration)
-        self.time_label.setText(f"{current_str} / {duration_str}")
+        # format_duration rounds to whole seconds, so sub-second polls produce the same label.
+        label_key = (
+            round(position) if position >= 0 else -1,
+            round(duration) if duration >= 0 else -1,
+        )
+        if label_key != self._time_label_key:
+            self._time_label_key = label_key
+            self.time_label.setText(f"{format_duration(position)} / {format_duration(duration)}")
 
     def force_ui_update(self):
         try:
@@ -1532,8 +1923,22 @@ class UIEventsMixin:
             if self._should_skip_ui_poll(now):
                 return
 
-            position = self.player.time_pos
-            duration = self.player.duration
+            try:
+                position = self.player.time_pos
+                # Duration rarely changes mid-track; near the end it is read every tick for end detection.
+                if (
+                    position is not None
+                    and now < self._next_duration_read_at
+                    and position < self._last_duration - 1.0
+                ):
+                    duration = self._last_duration
+                else:
+                    duration = self.player.duration
+                    self._next_duration_read_at = now + 2.0
+            except Exception:
+                # mpv is mid-teardown or reloading; back off instead of raising again next tick.
+                self._next_ui_poll_at = now + 0.5
+                return
             self._sync_progress_caches(now, position, duration)
             self._maybe_hide_background_cover(now, position, duration)
             self._sync_runtime_duration_for_current(duration)
@@ -1843,8 +2248,7 @@ class UIEventsMixin:
             "ignoreerrors": True,
             "remote_components": YTDLP_REMOTE_COMPONENTS,
         }
-        with yt_dlp.YoutubeDL(opts) as ydl:
-            info = ydl.extract_info(url, download=False)
+        info = _cached_extract_info(url, opts)
         formats = info.get("formats", []) if isinstance(info, dict) else []
         codec_variants: set[tuple[int, str, str]] = set()
         for item in formats:
@@ -1924,7 +2328,10 @@ class UIEventsMixin:
             self._apply_seek_profile_for_source(current_item)
         except Exception:
             pass
-        pos = self._safe_player_float("time_pos", 0.0)
+        # The UI tick already caches the playback position; only query mpv if nothing is cached yet.
+        pos = float(self._last_position or 0.0)
+        if pos <= 0.0:
+            pos = self._safe_player_float("time_pos", 0.0)
         was_paused = bool(self._cached_paused)
         self._quality_reload_until = time.monotonic() + 5.0
         self._pending_auto_next = False
@@ -1971,8 +2378,8 @@ class UIEventsMixin:
                 overlays = [
                     getattr(self, "overlay", None),
                     getattr(self, "speed_overlay", None),
-                    getattr(self, "playlist_overlay", None),
-                    getattr(self, "title_bar", None),
+                    self.playlist_overlay,
+                    self.title_bar,
                 ]
                 for w in overlays:
                     if w and (obj is w or w.isAncestorOf(obj)):
@@ -1983,50 +2390,7 @@ class UIEventsMixin:
         return False
 
     def _is_app_shortcut_key(self, event) -> bool:
-        key = event.key()
-        return key in {
-            Qt.Key_Escape,
-            Qt.Key_Right,
-            Qt.Key_Left,
-            Qt.Key_Up,
-            Qt.Key_Down,
-            Qt.Key_PageUp,
-            Qt.Key_PageDown,
-            Qt.Key_F4,
-            Qt.Key_Space,
-            Qt.Key_Enter,
-            Qt.Key_Return,
-            Qt.Key_F,
-            Qt.Key_Delete,
-            Qt.Key_Period,
-            Qt.Key_Comma,
-            Qt.Key_BracketRight,
-            Qt.Key_BracketLeft,
-            Qt.Key_Plus,
-            Qt.Key_Equal,
-            Qt.Key_Minus,
-            Qt.Key_0,
-            Qt.Key_2,
-            Qt.Key_4,
-            Qt.Key_6,
-            Qt.Key_8,
-            Qt.Key_B,
-            Qt.Key_M,
-            Qt.Key_S,
-            Qt.Key_P,
-            Qt.Key_V,
-            Qt.Key_R,
-            Qt.Key_G,
-            Qt.Key_H,
-            Qt.Key_J,
-            Qt.Key_K,
-            Qt.Key_I,
-            Qt.Key_U,
-            Qt.Key_O,
-            Qt.Key_L,
-            Qt.Key_X,
-            Qt.Key_Y,
-        }
+        return int(event.key()) in _APP_SHORTCUT_KEYS
 
     def _canonicalize_mpv_key(self, key_name: str) -> str:
         text = str(key_name or "").strip()
@@ -2225,18 +2589,26 @@ class UIEventsMixin:
                     self,
                     getattr(self, "overlay", None),
                     getattr(self, "speed_overlay", None),
-                    getattr(self, "playlist_overlay", None),
-                    getattr(self, "title_bar", None),
+                    self.playlist_overlay,
+                    self.title_bar,
                 }
                 target_window = obj.window() if isinstance(obj, QWidget) else None
                 if target_window not in owner_windows:
                     return QMainWindow.eventFilter(self, obj, event)
 
+                # One focusWidget() lookup per key press; the search box is a QLineEdit too.
                 focused = QApplication.focusWidget()
                 if isinstance(focused, QLineEdit):
                     return QMainWindow.eventFilter(self, obj, event)
-                if self._is_playlist_search_focused() or self._is_playlist_widget_focused():
-                    return QMainWindow.eventFilter(self, obj, event)
+                if focused is not None:
+                    playlist_widget = self.playlist_widget
+                    if (
+                        focused is self.playlist_search_input
+                        or focused is playlist_widget
+                        or playlist_widget.isAncestorOf(focused)
+                        or self.playlist_search_input.isAncestorOf(focused)
+                    ):
+                        return QMainWindow.eventFilter(self, obj, event)
 
                 if not self._is_app_shortcut_key(event):
                     if self._trigger_script_binding_for_event(event):
@@ -2246,6 +2618,13 @@ class UIEventsMixin:
                     return QMainWindow.eventFilter(self, obj, event)
                 self.keyPressEvent(event)
                 return True
+            if event.type() in _FOCUS_INVALIDATING_EVENTS:
+                # Activation can move between overlays and other apps without touching the main window.
+                self._cached_focus_state = None
+                return QMainWindow.eventFilter(self, obj, event)
+            if event.type() in (QEvent.MouseMove, QEvent.Enter, QEvent.Leave):
+                self._on_pointer_event()
+                return QMainWindow.eventFilter(self, obj, event)
             if event.type() == QEvent.DragLeave and self._is_owned_by_player(obj):
                 QTimer.singleShot(0, self._safe_end_playlist_drag_reveal_if_outside)
                 return QMainWindow.eventFilter(self, obj, event)
@@ -2259,7 +2638,7 @@ class UIEventsMixin:
 
     def wheelEvent(self, event):
         if (
-            hasattr(self, "playlist_overlay")
+            self.playlist_overlay is not None
             and self.playlist_overlay.isVisible()
             and self.playlist_overlay.geometry().contains(QCursor.pos())
         ):
@@ -2275,29 +2654,30 @@ class UIEventsMixin:
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
+            pos = event.position().toPoint()
+            global_pos = event.globalPosition().toPoint()
             if hasattr(self, "volume_popup") and self.volume_popup.isVisible():
-                global_pos = event.globalPosition().toPoint()
                 on_main_btn = self.mute_btn.rect().contains(self.mute_btn.mapFromGlobal(global_pos))
                 on_popup = self.volume_popup.rect().contains(self.volume_popup.mapFromGlobal(global_pos))
                 if not on_main_btn and not on_popup:
                     self.volume_popup.hide()
-            if event.position().x() >= self.width() - 20 and event.position().y() >= self.height() - 20:
+            if pos.x() >= self.width() - 20 and pos.y() >= self.height() - 20:
                 self._is_resizing = True
-                self.dragpos = event.globalPosition().toPoint()
+                self.dragpos = global_pos
                 self._start_size = self.size()
                 event.accept()
                 return
 
             if (
-                hasattr(self, "playlist_overlay")
+                self.playlist_overlay is not None
                 and self.playlist_overlay.isVisible()
                 and not getattr(self, "pinned_playlist", False)
             ):
-                if not self.playlist_overlay.geometry().contains(event.position().toPoint()):
+                if not self.playlist_overlay.geometry().contains(pos):
                     self.playlist_overlay.hide()
 
-            if self.video_container.geometry().contains(event.position().toPoint()) and not self.isFullScreen():
-                self.dragpos = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
+            if self.video_container.geometry().contains(pos) and not self.isFullScreen():
+                self.dragpos = global_pos - self.frameGeometry().topLeft()
                 event.accept()
                 return
 
@@ -2305,20 +2685,43 @@ class UIEventsMixin:
 
     def mouseMoveEvent(self, event):
         if self.dragpos is not None:
-            if hasattr(self, "_is_resizing") and self._is_resizing:
-                delta = event.globalPosition().toPoint() - self.dragpos
+            global_pos = event.globalPosition().toPoint()
+            if self._is_resizing:
+                delta = global_pos - self.dragpos
                 new_width = max(self.minimumWidth(), self._start_size.width() + delta.x())
                 new_height = max(self.minimumHeight(), self._start_size.height() + delta.y())
-                self.resize(new_width, new_height)
+                # Each resize reconfigures mpv's video surface; apply at most one per frame.
+                self._pending_resize = (new_width, new_height)
+                if not self._resize_timer.isActive():
+                    self._resize_timer.start()
             else:
-                self.move(event.globalPosition().toPoint() - self.dragpos)
+                # High-rate mice deliver several moves per frame; only the latest one is applied.
+                self._pending_drag_move = global_pos - self.dragpos
+                if not self._drag_move_timer.isActive():
+                    self._drag_move_timer.start()
 
             event.accept()
             return
 
         QMainWindow.mouseMoveEvent(self, event)
 
+    def _apply_pending_drag_move(self):
+        target = self._pending_drag_move
+        self._pending_drag_move = None
+        if target is not None:
+            self.move(target)
+
+    def _apply_pending_resize(self):
+        size = self._pending_resize
+        self._pending_resize = None
+        if size is not None:
+            self.resize(*size)
+
     def mouseReleaseEvent(self, event):
+        self._drag_move_timer.stop()
+        self._apply_pending_drag_move()
+        self._resize_timer.stop()
+        self._apply_pending_resize()
         self.dragpos = None
         self._is_resizing = False
         QMainWindow.mouseReleaseEvent(self, event)
@@ -2350,7 +2753,7 @@ class UIEventsMixin:
             event.acceptProposedAction()
 
     def _begin_playlist_drag_reveal(self) -> None:
-        if not hasattr(self, "playlist_overlay"):
+        if self.playlist_overlay is None:
             return
         self._playlist_drag_reveal_active = True
         if hasattr(self, "playlist_auto_hide_timer"):
@@ -2361,12 +2764,12 @@ class UIEventsMixin:
         self._sync_playlist_overlay_geometry()
         self.playlist_overlay.show()
         self.playlist_overlay.raise_()
-        if hasattr(self, "playlist_widget"):
+        if self.playlist_widget is not None:
             self.playlist_widget.updateGeometries()
             QTimer.singleShot(1, self.playlist_widget.update)
 
     def _end_playlist_drag_reveal(self) -> None:
-        if not hasattr(self, "playlist_overlay"):
+        if self.playlist_overlay is None:
             return
         self._playlist_drag_reveal_active = False
         if self._playlist_drag_opened_temporarily:
@@ -2380,7 +2783,7 @@ class UIEventsMixin:
         global_pos = QCursor.pos()
         in_main = self.frameGeometry().contains(global_pos)
         in_playlist = bool(
-            hasattr(self, "playlist_overlay")
+            self.playlist_overlay is not None
             and self.playlist_overlay.isVisible()
             and self.playlist_overlay.frameGeometry().contains(global_pos)
         )
@@ -2395,7 +2798,7 @@ class UIEventsMixin:
 
     def _is_cursor_over_playlist_panel(self) -> bool:
         return bool(
-            hasattr(self, "playlist_overlay")
+            self.playlist_overlay is not None
             and self.playlist_overlay.isVisible()
             and self.playlist_overlay.geometry().contains(QCursor.pos())
         )
@@ -2419,21 +2822,19 @@ class UIEventsMixin:
     def _focused_widget(self):
         return QApplication.focusWidget()
 
-    def _is_playlist_search_focused(self) -> bool:
-        focused = self._focused_widget()
-        if not focused or not hasattr(self, "playlist_search_input"):
+    def _is_playlist_search_focused(self, focused) -> bool:
+        if not focused or self.playlist_search_input is None:
             return False
         return focused is self.playlist_search_input or self.playlist_search_input.isAncestorOf(focused)
 
-    def _is_playlist_widget_focused(self) -> bool:
-        focused = self._focused_widget()
-        if not focused or not hasattr(self, "playlist_widget"):
+    def _is_playlist_widget_focused(self, focused) -> bool:
+        if not focused or self.playlist_widget is None:
             return False
         return focused is self.playlist_widget or self.playlist_widget.isAncestorOf(focused)
 
     def _handle_escape_shortcuts(self, key) -> bool:
-        if key == Qt.Key_Escape:
-            if hasattr(self, "playlist_overlay") and self.playlist_overlay.isVisible() and not self.pinned_playlist:
+        if key == _K_ESCAPE:
+            if self.playlist_overlay is not None and self.playlist_overlay.isVisible() and not self.pinned_playlist:
                 self.playlist_overlay.hide()
                 return True
             if self.isFullScreen():
@@ -2442,14 +2843,18 @@ class UIEventsMixin:
         return False
 
     def _handle_playlist_focus_shortcuts(self, event, key) -> bool:
-        if self._is_playlist_search_focused():
+        # One focusWidget() lookup serves both checks.
+        focused = self._focused_widget()
+        if focused is None:
+            return False
+        if self._is_playlist_search_focused(focused):
             QMainWindow.keyPressEvent(self, event)
             return True
-        if self._is_playlist_widget_focused():
-            if key in (Qt.Key_Enter, Qt.Key_Return):
+        if self._is_playlist_widget_focused(focused):
+            if key in (_K_ENTER, _K_RETURN):
                 self.play_selected_item()
                 return True
-            if key == Qt.Key_Delete:
+            if key == _K_DELETE:
                 if event.modifiers() & Qt.ShiftModifier:
                     self.delete_to_trash()
                 else:
@@ -2459,182 +2864,160 @@ class UIEventsMixin:
             return True
         return False
 
-    def _handle_open_shortcuts(self, key, mods) -> bool:
-        if key == Qt.Key_O and (mods & Qt.ControlModifier) and (mods & Qt.ShiftModifier):
+    def _handle_open_shortcuts(self, event, key, mods) -> bool:
+        if key == _K_O and (mods & Qt.ControlModifier) and (mods & Qt.ShiftModifier):
             self.add_folder_dialog()
             return True
-        if key == Qt.Key_O and (mods & Qt.ControlModifier):
+        if key == _K_O and (mods & Qt.ControlModifier):
             self.add_files_dialog()
             return True
-        if key == Qt.Key_L and (mods & Qt.ControlModifier):
+        if key == _K_L and (mods & Qt.ControlModifier):
             self.open_url_dialog()
             return True
         return False
 
-    def _handle_transport_shortcuts(self, event, key) -> bool:
-        media_toggle = getattr(Qt, "Key_MediaTogglePlayPause", None)
-        media_play = getattr(Qt, "Key_MediaPlay", None)
-        media_pause = getattr(Qt, "Key_MediaPause", None)
-        media_next = getattr(Qt, "Key_MediaNext", None)
-        media_prev = getattr(Qt, "Key_MediaPrevious", None)
-        media_stop = getattr(Qt, "Key_MediaStop", None)
-
-        if media_toggle is not None and key == media_toggle:
+    def _handle_transport_shortcuts(self, event, key, mods) -> bool:
+        if _K_MEDIA_TOGGLE_PLAY_PAUSE is not None and key == _K_MEDIA_TOGGLE_PLAY_PAUSE:
             if hasattr(self, "_handle_external_media_action"):
                 self._handle_external_media_action("toggle")
             else:
                 self.toggle_play()
             return True
-        if media_play is not None and key == media_play:
+        if _K_MEDIA_PLAY is not None and key == _K_MEDIA_PLAY:
             if hasattr(self, "_handle_external_media_action"):
                 self._handle_external_media_action("toggle")
             else:
                 self.toggle_play()
             return True
-        if media_pause is not None and key == media_pause:
+        if _K_MEDIA_PAUSE is not None and key == _K_MEDIA_PAUSE:
             if hasattr(self, "_handle_external_media_action"):
                 self._handle_external_media_action("toggle")
             else:
                 self.toggle_play()
             return True
-        if media_next is not None and key == media_next:
+        if _K_MEDIA_NEXT is not None and key == _K_MEDIA_NEXT:
             if hasattr(self, "_handle_external_media_action"):
                 self._handle_external_media_action("next")
             else:
                 self.next_video()
             return True
-        if media_prev is not None and key == media_prev:
+        if _K_MEDIA_PREVIOUS is not None and key == _K_MEDIA_PREVIOUS:
             if hasattr(self, "_handle_external_media_action"):
                 self._handle_external_media_action("previous")
             else:
                 self.prev_video()
             return True
-        if media_stop is not None and key == media_stop:
+        if _K_MEDIA_STOP is not None and key == _K_MEDIA_STOP:
             if hasattr(self, "_handle_external_media_action"):
                 self._handle_external_media_action("stop")
             else:
                 self.stop_playback()
             return True
-        if key == Qt.Key_Right:
+        if key == _K_RIGHT:
             self.seek_relative(5)
             return True
-        if key == Qt.Key_Left:
+        if key == _K_LEFT:
             self.seek_relative(-5)
             return True
-        if key == Qt.Key_Up:
+        if key == _K_UP:
             self.vol_slider.setValue(self.vol_slider.value() + 5)
             return True
-        if key == Qt.Key_Down:
+        if key == _K_DOWN:
             self.vol_slider.setValue(self.vol_slider.value() - 5)
             return True
-        if key == Qt.Key_PageUp:
+        if key == _K_PAGE_UP:
             self.prev_video()
             return True
-        if key == Qt.Key_PageDown:
+        if key == _K_PAGE_DOWN:
             self.next_video()
             return True
-        if key == Qt.Key_F4:
+        if key == _K_F4:
             self.toggle_full_duration_scan()
             return True
-        if key == Qt.Key_Space:
+        if key == _K_SPACE:
             self.toggle_play()
             return True
-        if key in (Qt.Key_Enter, Qt.Key_Return, Qt.Key_F):
+        if key in (_K_ENTER, _K_RETURN, _K_F):
             self.toggle_fullscreen()
             return True
-        if key == Qt.Key_Delete:
+        if key == _K_DELETE:
             if event.modifiers() & Qt.ShiftModifier:
                 self.delete_to_trash()
             else:
                 self.remove_selected_from_playlist()
             return True
-        if key == Qt.Key_Period:
+        if key == _K_PERIOD:
             self.player.command("frame-step")
             return True
-        if key == Qt.Key_Comma:
+        if key == _K_COMMA:
             self.player.command("frame-back-step")
             return True
-        if key == Qt.Key_BracketRight:
+        if key == _K_BRACKET_RIGHT:
             self.change_speed_step(1)
             return True
-        if key == Qt.Key_BracketLeft:
+        if key == _K_BRACKET_LEFT:
             self.change_speed_step(-1)
             return True
-        if key == Qt.Key_M:
+        if key == _K_M:
             self.toggle_mute()
             return True
-        if key == Qt.Key_S and not (event.modifiers() & Qt.ShiftModifier):
+        if key == _K_S and not (event.modifiers() & Qt.ShiftModifier):
             self.screenshot_save_as()
             return True
-        if key == Qt.Key_P:
+        if key == _K_P:
             self.toggle_playlist_panel()
             return True
-        if key == Qt.Key_V:
+        if key == _K_V:
             self.open_video_settings()
             return True
         return False
 
-    def _handle_zoom_shortcuts(self, key) -> bool:
-        if key == Qt.Key_Plus or key == Qt.Key_Equal:
+    def _after_zoom_change(self, message: str) -> None:
+        self.show_status_overlay(message)
+        self._save_zoom_setting()
+        self.sync_size()
+
+    def _handle_zoom_shortcuts(self, event, key, mods) -> bool:
+        if key == _K_PLUS or key == _K_EQUAL:
             self.window_zoom += 0.1
-            self.show_status_overlay(tr("Zoom: {}").format(f"{self.window_zoom:.1f}"))
-            self._save_zoom_setting()
-            self.sync_size()
+            self._after_zoom_change(self._fmt_zoom.format(f"{self.window_zoom:.1f}"))
             return True
-        if key == Qt.Key_Minus:
+        if key == _K_MINUS:
             self.window_zoom = max(-2.0, self.window_zoom - 0.1)
-            self.show_status_overlay(tr("Zoom: {}").format(f"{self.window_zoom:.1f}"))
-            self._save_zoom_setting()
-            self.sync_size()
+            self._after_zoom_change(self._fmt_zoom.format(f"{self.window_zoom:.1f}"))
             return True
-        if key == Qt.Key_0:
+        if key == _K_0:
             self.window_zoom = 0.0
-            self.show_status_overlay(tr("Zoom Reset"))
-            self._save_zoom_setting()
             self._set_mpv_property_safe("video_pan_x", 0.0, min_interval_sec=0.05)
             self._set_mpv_property_safe("video_pan_y", 0.0, min_interval_sec=0.05)
-            self.sync_size()
+            self._after_zoom_change(tr("Zoom Reset"))
             return True
         return False
 
-    def _handle_pan_shortcuts(self, key) -> bool:
-        if key == Qt.Key_4:
-            if (self.player.video_zoom or 0.0) > 0.0:
-                next_x = min(3.0, (self.player.video_pan_x or 0.0) + 0.05)
-                self._set_mpv_property_safe("video_pan_x", next_x, min_interval_sec=0.03)
-                self.show_status_overlay(tr("Pan Left"))
-            return True
-        if key == Qt.Key_6:
-            if (self.player.video_zoom or 0.0) > 0.0:
-                next_x = max(-3.0, (self.player.video_pan_x or 0.0) - 0.05)
-                self._set_mpv_property_safe("video_pan_x", next_x, min_interval_sec=0.03)
-                self.show_status_overlay(tr("Pan Right"))
-            return True
-        if key == Qt.Key_8:
-            if (self.player.video_zoom or 0.0) > 0.0:
-                next_y = min(3.0, (self.player.video_pan_y or 0.0) + 0.05)
-                self._set_mpv_property_safe("video_pan_y", next_y, min_interval_sec=0.03)
-                self.show_status_overlay(tr("Pan Up"))
-            return True
-        if key == Qt.Key_2:
-            if (self.player.video_zoom or 0.0) > 0.0:
-                next_y = max(-3.0, (self.player.video_pan_y or 0.0) - 0.05)
-                self._set_mpv_property_safe("video_pan_y", next_y, min_interval_sec=0.03)
-                self.show_status_overlay(tr("Pan Down"))
-            return True
-        return False
+    def _handle_pan_shortcuts(self, event, key, mods) -> bool:
+        action = _PAN_SHORTCUTS.get(key)
+        if action is None:
+            return False
+        # Panning only means something while zoomed in; the key is still consumed.
+        if (self.player.video_zoom or 0.0) > 0.0:
+            prop, step, message = action
+            current = getattr(self.player, prop) or 0.0
+            self._set_mpv_property_safe(prop, max(-3.0, min(3.0, current + step)), min_interval_sec=0.03)
+            self.show_status_overlay(tr(message))
+        return True
 
-    def _handle_brightness_shortcut(self, key, mods) -> bool:
-        if key != Qt.Key_B:
+    def _handle_brightness_shortcut(self, event, key, mods) -> bool:
+        if key != _K_B:
             return False
         if mods & Qt.ShiftModifier:
-            self.player.brightness = max(-100, self.player.brightness - 5)
+            brightness = max(-100, self.player.brightness - 5)
         else:
-            self.player.brightness = min(100, self.player.brightness + 5)
+            brightness = min(100, self.player.brightness + 5)
+        self.player.brightness = brightness
         cfg = load_video_settings()
-        cfg["brightness"] = int(self.player.brightness or 0)
+        cfg["brightness"] = int(brightness or 0)
         save_video_settings(cfg)
-        self.show_status_overlay(tr("Brightness: {}").format(self.player.brightness))
+        self.show_status_overlay(self._fmt_brightness.format(brightness))
         return True
 
     def _save_video_transform_settings(self):
@@ -2684,88 +3067,75 @@ class UIEventsMixin:
             )
         )
 
-    def _handle_rotation_shortcuts(self, key, mods) -> bool:
-        if key == Qt.Key_R and (mods & Qt.ControlModifier):
+    def _handle_rotation_shortcuts(self, event, key, mods) -> bool:
+        if key == _K_R and (mods & Qt.ControlModifier):
             self.reset_video_rotation()
             return True
-        if key == Qt.Key_R:
+        if key == _K_R:
             self.rotate_video_90()
             return True
         return False
 
-    def _handle_mirror_shortcuts(self, key) -> bool:
-        if key == Qt.Key_X:
+    def _handle_mirror_shortcuts(self, event, key, mods) -> bool:
+        if key == _K_X:
             self.toggle_mirror_horizontal()
             return True
-        if key == Qt.Key_Y:
+        if key == _K_Y:
             self.toggle_mirror_vertical()
             return True
         return False
 
-    def _handle_subtitle_runtime_shortcuts(self, key, mods) -> bool:
-        if key == Qt.Key_S and (mods & Qt.ShiftModifier):
+    def _handle_subtitle_runtime_shortcuts(self, event, key, mods) -> bool:
+        if key == _K_S and (mods & Qt.ShiftModifier):
             self.open_opensubtitles_dialog()
             return True
-        if key == Qt.Key_G:
+        if key == _K_G:
             self.player.sub_delay -= 0.1
             self._persist_runtime_subtitle_settings()
-            self.show_status_overlay(tr("Delay: {}s").format(f"{self.player.sub_delay:.1f}"))
+            self.show_status_overlay(self._fmt_sub_delay.format(f"{self.player.sub_delay:.1f}"))
             return True
-        if key == Qt.Key_H:
+        if key == _K_H:
             self.player.sub_delay += 0.1
             self._persist_runtime_subtitle_settings()
-            self.show_status_overlay(tr("Delay: {}s").format(f"{self.player.sub_delay:.1f}"))
+            self.show_status_overlay(self._fmt_sub_delay.format(f"{self.player.sub_delay:.1f}"))
             return True
-        if key == Qt.Key_J:
+        if key == _K_J:
             self.player.sub_font_size = max(1, self.player.sub_font_size - 1)
             self.player.sub_scale = max(0.2, min(5.0, float(self.player.sub_font_size) / 55.0))
             self._persist_runtime_subtitle_settings()
-            self.show_status_overlay(tr("Size: {}").format(self.player.sub_font_size))
+            self.show_status_overlay(self._fmt_sub_size.format(self.player.sub_font_size))
             return True
-        if key == Qt.Key_K:
+        if key == _K_K:
             self.player.sub_font_size = min(120, self.player.sub_font_size + 1)
             self.player.sub_scale = max(0.2, min(5.0, float(self.player.sub_font_size) / 55.0))
             self._persist_runtime_subtitle_settings()
-            self.show_status_overlay(tr("Size: {}").format(self.player.sub_font_size))
+            self.show_status_overlay(self._fmt_sub_size.format(self.player.sub_font_size))
             return True
-        if key == Qt.Key_I and (mods & Qt.ShiftModifier):
+        if key == _K_I and (mods & Qt.ShiftModifier):
             self.toggle_mpv_stats_overlay()
             return True
-        if key == Qt.Key_U:
+        if key == _K_U:
             self.player.sub_pos = max(0, self.player.sub_pos - 1)
             self._persist_runtime_subtitle_settings()
-            self.show_status_overlay(tr("Pos: {}").format(self.player.sub_pos))
+            self.show_status_overlay(self._fmt_sub_pos.format(self.player.sub_pos))
             return True
-        if key == Qt.Key_I:
+        if key == _K_I:
             self.player.sub_pos = min(100, self.player.sub_pos + 1)
             self._persist_runtime_subtitle_settings()
-            self.show_status_overlay(tr("Pos: {}").format(self.player.sub_pos))
+            self.show_status_overlay(self._fmt_sub_pos.format(self.player.sub_pos))
             return True
         return False
 
     def keyPressEvent(self, event):
-        key = event.key()
+        key = int(event.key())
         mods = event.modifiers()
 
         if self._handle_escape_shortcuts(key):
             return
         if self._handle_playlist_focus_shortcuts(event, key):
             return
-        if self._handle_open_shortcuts(key, mods):
-            return
-        if self._handle_transport_shortcuts(event, key):
-            return
-        if self._handle_zoom_shortcuts(key):
-            return
-        if self._handle_pan_shortcuts(key):
-            return
-        if self._handle_brightness_shortcut(key, mods):
-            return
-        if self._handle_rotation_shortcuts(key, mods):
-            return
-        if self._handle_mirror_shortcuts(key):
-            return
-        if self._handle_subtitle_runtime_shortcuts(key, mods):
-            return
+        for handler_name in _KEY_SHORTCUT_HANDLERS.get(key, ()):
+            if getattr(self, handler_name)(event, key, mods):
+                return
 
         QMainWindow.keyPressEvent(self, event)
@@ -13,10 +13,15 @@ from PySide6.QtCore import (
     QByteArray,
     QDataStream,
     QIODevice,
+    QEvent,
+    QRectF,
 )
-from PySide6.QtGui import QColor, QFont, QPainter, QPainterPath, QCursor
+from PySide6.QtGui import QColor, QFont, QImage, QPainter, QPainterPath, QPixmap, QCursor
 from PySide6.QtWidgets import (
     QAbstractItemView,
+    QGraphicsBlurEffect,
+    QGraphicsPixmapItem,
+    QGraphicsScene,
     QStyle,
     QStyleOptionSlider,
     QStyledItemDelegate,
@@ -83,6 +88,8 @@ class PlaylistListModel(QAbstractListModel):
         self._durations: dict[str, str] = {}
         self._titles: dict[str, str] = {}
         self._resolved_titles: dict[str, str] = {}
+        # path -> (display name, casefolded name) for the filter proxy.
+        self._search_keys: dict[str, tuple[str, str]] = {}
 
     def _rebuild_row_index(self):
         self._row_by_path = {path: row for row, path in enumerate(self._paths)}
@@ -222,6 +229,7 @@ class PlaylistListModel(QAbstractListModel):
         self._durations = dict(durations)
         self._titles = dict(titles or {})
         self._resolved_titles = {p: _playlist_item_name(p) for p in self._paths}
+        self._search_keys = {}
         self.endResetModel()
 
     def append_paths(self, paths: list[str], durations: dict[str, str], titles: dict[str, str] = None):
@@ -249,6 +257,23 @@ class PlaylistListModel(QAbstractListModel):
         self.dataChanged.emit(idx, idx, [PLAYLIST_DURATION_ROLE])
         return True
 
+    def update_durations_bulk(self, durations: dict):
+        # One dataChanged over the touched row span instead of one signal per item.
+        first = last = None
+        for path, duration_text in durations.items():
+            self._durations[path] = duration_text
+            row = self._row_by_path.get(path)
+            if row is None:
+                continue
+            if first is None or row < first:
+                first = row
+            if last is None or row > last:
+                last = row
+        if first is None:
+            return False
+        self.dataChanged.emit(self.index(first, 0), self.index(last, 0), [PLAYLIST_DURATION_ROLE])
+        return True
+
     def update_title(self, path: str, title: str):
         self._titles[path] = title
         if path not in self._resolved_titles:
@@ -258,6 +283,16 @@ class PlaylistListModel(QAbstractListModel):
             idx = self.index(row, 0)
             self.dataChanged.emit(idx, idx, [PLAYLIST_NAME_ROLE])
 
+    def search_key(self, row: int) -> str:
+        path = self._paths[row]
+        name = self._titles.get(path, self._resolved_titles.get(path, path))
+        cached = self._search_keys.get(path)
+        if cached is not None and cached[0] is name:
+            return cached[1]
+        folded = str(name or "").casefold()
+        self._search_keys[path] = (name, folded)
+        return folded
+
     def row_for_path(self, path: str) -> int:
         row = self._row_by_path.get(str(path))
         return int(row) if row is not None else -1
@@ -282,10 +317,8 @@ class PlaylistFilterProxyModel(QSortFilterProxyModel):
     def filterAcceptsRow(self, source_row, source_parent):
         if not self._query:
             return True
-        model = self.sourceModel()
-        idx = model.index(source_row, 0, source_parent)
-        name = str(model.data(idx, PLAYLIST_NAME_ROLE) or "")
-        return self._query in name.casefold()
+        # Plain substring against a cached casefolded name; no QModelIndex/data() round trip.
+        return self._query in self.sourceModel().search_key(source_row)
 
 
 class PlaylistItemDelegate(QStyledItemDelegate):
@@ -489,7 +522,9 @@ class ChapterSlider(ClickableSlider):
             self._current_time = max(0.0, float(seconds or 0.0))
         except (TypeError, ValueError):
             self._current_time = 0.0
-        self.update()
+        # The playhead only changes how chapter markers are drawn.
+        if self._chapters:
+            self.update()
 
     def set_chapters(self, chapters):
         cleaned = []
@@ -635,6 +670,114 @@ class RoundedPanel(QWidget):
 
 
 
+# Blurred 9-slice sources keyed by (radius, blur, rgba); size independent.
+_SHADOW_PIXMAPS: dict[tuple, QPixmap] = {}
+
+
+def _shadow_source_pixmap(radius: int, blur: int, color: QColor) -> QPixmap:
+    key = (radius, blur, color.rgba())
+    cached = _SHADOW_PIXMAPS.get(key)
+    if cached is not None:
+        return cached
+
+    corner = blur + radius + 1
+    side = corner * 2 + 1
+    shape = QImage(side, side, QImage.Format_ARGB32_Premultiplied)
+    shape.fill(Qt.transparent)
+    painter = QPainter(shape)
+    painter.setRenderHint(QPainter.Antialiasing, True)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(color)
+    painter.drawRoundedRect(QRectF(blur, blur, side - blur * 2, side - blur * 2), radius, radius)
+    painter.end()
+
+    # One offscreen blur pass per key instead of one per frame.
+    scene = QGraphicsScene()
+    item = QGraphicsPixmapItem(QPixmap.fromImage(shape))
+    effect = QGraphicsBlurEffect()
+    effect.setBlurRadius(blur)
+    effect.setBlurHints(QGraphicsBlurEffect.QualityHint)
+    item.setGraphicsEffect(effect)
+    scene.addItem(item)
+
+    blurred = QImage(side, side, QImage.Format_ARGB32_Premultiplied)
+    blurred.fill(Qt.transparent)
+    painter = QPainter(blurred)
+    scene.render(painter, QRectF(0, 0, side, side), QRectF(0, 0, side, side))
+    painter.end()
+
+    pixmap = QPixmap.fromImage(blurred)
+    _SHADOW_PIXMAPS[key] = pixmap
+    return pixmap
+
+
+class PanelShadow(QWidget):
+    """Paints a cached blurred shadow behind a sibling panel."""
+
+    def __init__(self, panel: QWidget, blur: int, offset_y: int, color: QColor):
+        super().__init__(panel.parentWidget())
+        self.panel = panel
+        self.blur = max(1, int(blur))
+        self.offset_y = int(offset_y)
+        self.color = QColor(color)
+
+        self.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+        self.setAttribute(Qt.WA_TranslucentBackground, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+        panel.installEventFilter(self)
+        self._sync_geometry()
+        self.lower()
+        self.setVisible(panel.isVisible())
+
+    def _shadow_radius(self) -> int:
+        if self.panel.objectName() == "PlaylistPanel":
+            return 0
+        return int(getattr(self.panel, "radius", 0))
+
+    def _sync_geometry(self):
+        rect = self.panel.geometry()
+        self.setGeometry(rect.adjusted(-self.blur, -self.blur, self.blur, self.blur + self.offset_y))
+
+    def eventFilter(self, obj, event):
+        if obj is self.panel:
+            etype = event.type()
+            if etype in (QEvent.Move, QEvent.Resize):
+                self._sync_geometry()
+            elif etype == QEvent.Show:
+                self._sync_geometry()
+                self.show()
+                self.lower()
+            elif etype == QEvent.Hide:
+                self.hide()
+        return False
+
+    def paintEvent(self, _event):
+        radius = self._shadow_radius()
+        source = _shadow_source_pixmap(radius, self.blur, self.color)
+        corner = self.blur + radius + 1
+        side = source.width()
+
+        target = QRect(0, self.offset_y, self.width(), self.height() - self.offset_y)
+        painter = QPainter(self)
+        if target.width() < corner * 2 or target.height() < corner * 2:
+            painter.drawPixmap(target, source)
+            return
+
+        src_x = (0, corner, side - corner)
+        src_w = (corner, side - corner * 2, corner)
+        dst_x = (target.x(), target.x() + corner, target.right() + 1 - corner)
+        dst_w = (corner, target.width() - corner * 2, corner)
+        dst_y = (target.y(), target.y() + corner, target.bottom() + 1 - corner)
+        dst_h = (corner, target.height() - corner * 2, corner)
+        for row in range(3):
+            for col in range(3):
+                painter.drawPixmap(
+                    QRect(dst_x[col], dst_y[row], dst_w[col], dst_h[row]),
+                    source,
+                    QRect(src_x[col], src_x[row], src_w[col], src_w[row]),
+                )
+
+
 class OverlayWindow(QWidget):
     def __init__(self, owner: QMainWindow):
         super().__init__(owner)
@@ -2,11 +2,13 @@ import os
 import sys
 import subprocess
 import json
+import math
 import struct
 import time
 import hashlib
 import shutil
 import zipfile
+from functools import lru_cache
 from pathlib import Path
 from urllib.error import HTTPError, URLError
 from urllib.parse import parse_qs, quote, urlencode, urlparse, unquote
@@ -93,6 +95,17 @@ VIDEO_EXTENSION_SET = set(VIDEO_EXTENSIONS)
 AUDIO_EXTENSION_SET = set(AUDIO_EXTENSIONS)
 ARCHIVE_EXTENSION_SET = set(ARCHIVE_EXTENSIONS)
 ARCHIVE_SOURCE_SCHEME = "cadre-archive"
+# Import scans test the raw filename suffix against these before building any Path objects.
+_PLAYABLE_EXT_SET = frozenset(e.lower() for e in (*VIDEO_EXTENSIONS, *AUDIO_EXTENSIONS, *ARCHIVE_EXTENSIONS))
+_PLAYABLE_EXT_SET_NO_AUDIO = frozenset(e.lower() for e in (*VIDEO_EXTENSIONS, *ARCHIVE_EXTENSIONS))
+
+
+def _name_suffix(name: str) -> str:
+    # Matches Path(name).suffix.lower() for plain filenames (".hidden" has no suffix).
+    dot = name.rfind(".")
+    if dot <= 0:
+        return ""
+    return name[dot:].lower()
 
 
 def is_media_file(path: Path, include_audio: bool = True) -> bool:
@@ -290,7 +303,12 @@ def get_user_data_dir() -> Path:
 
 
 def is_stream_url(value: str) -> bool:
-    parsed = urlparse(str(value or ""))
+    return _is_stream_url_text(str(value or ""))
+
+
+@lru_cache(maxsize=8192)
+def _is_stream_url_text(value: str) -> bool:
+    parsed = urlparse(value)
     return bool(parsed.scheme and parsed.netloc)
 
 
@@ -728,12 +746,15 @@ def format_duration(seconds: float) -> str:
     if seconds is None:
         return "--:--"
     
-    import math
     if not math.isfinite(seconds) or seconds < 0:
         return "--:--"
 
     # Round to nearest second to reduce one-second jitter between probe/runtime sources.
-    total_seconds = int(round(seconds))
+    return _format_whole_seconds(int(round(seconds)))
+
+
+@lru_cache(maxsize=8192)
+def _format_whole_seconds(total_seconds: int) -> str:
     hours = total_seconds // 3600
     minutes = (total_seconds % 3600) // 60
     secs = total_seconds % 60
@@ -766,15 +787,18 @@ def list_folder_media(folder: Path, recursive: bool = False, include_audio: bool
             if item.is_file() and is_playable_file(item, include_audio=include_audio)
         ]
 
-def collect_paths(
+def collect_paths_with_exts(
     paths: list[Path],
     recursive: bool = False,
     include_audio: bool = True,
     progress_cb=None,
     progress_step: int = 100,
-) -> list[str]:
+) -> tuple[list[str], list[str]]:
+    # Parallel lists (path, lowercased suffix) so callers can classify without re-parsing.
     files = []
+    exts = []
     pending_emit = 0
+    playable_exts = _PLAYABLE_EXT_SET if include_audio else _PLAYABLE_EXT_SET_NO_AUDIO
 
     def maybe_emit(force: bool = False):
         nonlocal pending_emit
@@ -784,31 +808,70 @@ def collect_paths(
             progress_cb(len(files))
             pending_emit = 0
 
+    def scan_dir(folder: str):
+        nonlocal pending_emit
+        try:
+            with os.scandir(folder) as it:
+                entries = list(it)
+        except OSError:
+            return
+        subdirs = []
+        matches = []
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    # Same as os.walk(followlinks=False): symlinked folders are not entered.
+                    if recursive and not entry.is_symlink():
+                        subdirs.append(entry)
+                    continue
+            except OSError:
+                continue
+            ext = _name_suffix(entry.name)
+            if ext in playable_exts:
+                matches.append((entry, ext))
+        matches.sort(key=lambda item: item[0].name.lower())
+        for entry, ext in matches:
+            try:
+                if not entry.is_file():
+                    continue
+                is_link = entry.is_symlink()
+            except OSError:
+                continue
+            files.append(os.path.realpath(entry.path) if is_link else entry.path)
+            exts.append(ext)
+            pending_emit += 1
+            maybe_emit()
+        subdirs.sort(key=lambda entry: entry.name.lower())
+        for entry in subdirs:
+            scan_dir(entry.path)
+
     for path in paths:
         resolved = path.resolve()
         if resolved.is_file() and is_playable_file(resolved, include_audio=include_audio):
             files.append(str(resolved))
+            exts.append(resolved.suffix.lower())
             pending_emit += 1
             maybe_emit()
         elif resolved.is_dir():
-            if recursive:
-                for root, dirs, filenames in os.walk(resolved):
-                    dirs.sort(key=lambda d: d.lower())
-                    filenames.sort(key=lambda f: f.lower())
-                    for filename in filenames:
-                        full_path = Path(root) / filename
-                        if is_playable_file(full_path, include_audio=include_audio):
-                            files.append(str(full_path.resolve()))
-                            pending_emit += 1
-                            maybe_emit()
-            else:
-                for item in sorted(resolved.iterdir(), key=lambda p: p.name.lower()):
-                    if item.is_file() and is_playable_file(item, include_audio=include_audio):
-                        files.append(str(item.resolve()))
-                        pending_emit += 1
-                        maybe_emit()
+            scan_dir(str(resolved))
     maybe_emit(force=True)
-    return files
+    return files, exts
+
+
+def collect_paths(
+    paths: list[Path],
+    recursive: bool = False,
+    include_audio: bool = True,
+    progress_cb=None,
+    progress_step: int = 100,
+) -> list[str]:
+    return collect_paths_with_exts(
+        paths,
+        recursive=recursive,
+        include_audio=include_audio,
+        progress_cb=progress_cb,
+        progress_step=progress_step,
+    )[0]
 
 def reveal_path(path: str):
     path_obj = Path(path)